@@ -0,0 +1,117 @@
+"""baseline schema (기존 create_all 스키마)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# 이 시점의 UUIDType은 String(36)으로 저장했다
+UUID = sa.String(36)
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", UUID, primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("hashed_password", sa.String(255), nullable=False),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("department", sa.String(100)),
+        sa.Column("position", sa.String(100)),
+        sa.Column("role", sa.String(20), nullable=False),
+        sa.Column("is_active", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "approvals",
+        sa.Column("id", UUID, primary_key=True),
+        sa.Column("title", sa.String(300), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("category", sa.String(100)),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("author_id", UUID, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_table(
+        "approval_lines",
+        sa.Column("id", UUID, primary_key=True),
+        sa.Column("approval_id", UUID, sa.ForeignKey("approvals.id"), nullable=False),
+        sa.Column("approver_id", UUID, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("order", sa.Integer(), nullable=False),
+        sa.Column("action", sa.String(20), nullable=False),
+        sa.Column("comment", sa.Text()),
+        sa.Column("acted_at", sa.DateTime(), nullable=True),
+    )
+    op.create_table(
+        "approval_logs",
+        sa.Column("id", UUID, primary_key=True),
+        sa.Column("approval_id", UUID, sa.ForeignKey("approvals.id"), nullable=False),
+        sa.Column("user_id", UUID, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("action", sa.String(50), nullable=False),
+        sa.Column("comment", sa.Text()),
+        sa.Column("created_at", sa.DateTime()),
+    )
+    op.create_table(
+        "tasks",
+        sa.Column("id", UUID, primary_key=True),
+        sa.Column("title", sa.String(300), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("priority", sa.String(20)),
+        sa.Column("due_date", sa.DateTime(), nullable=True),
+        sa.Column("creator_id", UUID, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("assignee_id", UUID, sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_table(
+        "notices",
+        sa.Column("id", UUID, primary_key=True),
+        sa.Column("title", sa.String(300), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("is_pinned", sa.Boolean()),
+        sa.Column("author_id", UUID, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_table(
+        "schedules",
+        sa.Column("id", UUID, primary_key=True),
+        sa.Column("title", sa.String(300), nullable=False),
+        sa.Column("description", sa.Text()),
+        sa.Column("start_time", sa.DateTime(), nullable=False),
+        sa.Column("end_time", sa.DateTime(), nullable=False),
+        sa.Column("location", sa.String(255)),
+        sa.Column("creator_id", UUID, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime()),
+        sa.Column("updated_at", sa.DateTime()),
+    )
+    op.create_table(
+        "chat_messages",
+        sa.Column("id", UUID, primary_key=True),
+        sa.Column("user_id", UUID, sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("role", sa.String(20), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("tool_calls", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime()),
+    )
+
+
+def downgrade():
+    for table in (
+        "chat_messages", "schedules", "notices", "tasks",
+        "approval_logs", "approval_lines", "approvals", "users",
+    ):
+        op.drop_table(table)
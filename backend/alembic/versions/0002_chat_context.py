@@ -0,0 +1,48 @@
+"""chat context: token_count, chat_summaries, (user_id, created_at) 인덱스
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+마이그레이션 도입 전 create_all로 이미 만들어진 DB가 있으므로 존재 여부를 확인하고 적용한다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+UUID = sa.String(36)
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    columns = {c["name"] for c in inspector.get_columns("chat_messages")}
+    if "token_count" not in columns:
+        with op.batch_alter_table("chat_messages") as batch:
+            batch.add_column(sa.Column("token_count", sa.Integer(), nullable=True))
+
+    indexes = {i["name"] for i in inspector.get_indexes("chat_messages")}
+    if "ix_chat_messages_user_created" not in indexes:
+        op.create_index("ix_chat_messages_user_created", "chat_messages", ["user_id", "created_at"])
+
+    if not inspector.has_table("chat_summaries"):
+        op.create_table(
+            "chat_summaries",
+            sa.Column("user_id", UUID, sa.ForeignKey("users.id"), primary_key=True),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("token_count", sa.Integer(), nullable=False),
+            sa.Column("covered_until", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime()),
+        )
+
+
+def downgrade():
+    op.drop_table("chat_summaries")
+    op.drop_index("ix_chat_messages_user_created", table_name="chat_messages")
+    with op.batch_alter_table("chat_messages") as batch:
+        batch.drop_column("token_count")
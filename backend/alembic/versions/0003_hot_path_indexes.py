@@ -0,0 +1,50 @@
+"""hot path 복합 인덱스
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+목록 API(app/api/*.py)와 에이전트 조회 도구(app/agent/executor.py)의 조회 형태에 맞춘다.
+등호 조건 컬럼을 앞에, 키셋 페이지네이션 정렬 키(created_at/start_time, id)를 뒤에 둔다.
+"""
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    # 사용자 목록 (is_active, 이름순)
+    ("ix_users_active_name", "users", ["is_active", "name", "id"]),
+    # 내 결재 / 상태별 결재 / 전체 결재 (최신순)
+    ("ix_approvals_author_created", "approvals", ["author_id", "created_at", "id"]),
+    ("ix_approvals_status_created", "approvals", ["status", "created_at", "id"]),
+    ("ix_approvals_created", "approvals", ["created_at", "id"]),
+    # 결재 대기함 (approver_id, action='pending') → approval_id
+    ("ix_approval_lines_approver_action", "approval_lines", ["approver_id", "action", "approval_id"]),
+    # 결재 문서별 결재선 로딩 (순서대로)
+    ("ix_approval_lines_approval_order", "approval_lines", ["approval_id", "order"]),
+    ("ix_approval_logs_approval", "approval_logs", ["approval_id"]),
+    # 내 업무 (creator OR assignee), 상태별, 전체
+    ("ix_tasks_creator_created", "tasks", ["creator_id", "created_at", "id"]),
+    ("ix_tasks_assignee_created", "tasks", ["assignee_id", "created_at", "id"]),
+    ("ix_tasks_status_created", "tasks", ["status", "created_at", "id"]),
+    ("ix_tasks_created", "tasks", ["created_at", "id"]),
+    # 공지 (고정 우선, 최신순)
+    ("ix_notices_pinned_created", "notices", ["is_pinned", "created_at", "id"]),
+    # 내 일정 / 전체 일정 (시작 시각순)
+    ("ix_schedules_creator_start", "schedules", ["creator_id", "start_time", "id"]),
+    ("ix_schedules_start", "schedules", ["start_time", "id"]),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,107 @@
+"""UUID 컬럼을 네이티브 저장 형식으로 변환 (PostgreSQL UUID, SQLite 16바이트 BLOB)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+
+기존 값(36자 문자열)을 변환하는 데이터 마이그레이션을 포함한다. 그 외 DB는 문자열 저장을 유지한다.
+"""
+
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+UUID_COLUMNS = {
+    "users": ["id"],
+    "approvals": ["id", "author_id"],
+    "approval_lines": ["id", "approval_id", "approver_id"],
+    "approval_logs": ["id", "approval_id", "user_id"],
+    "tasks": ["id", "creator_id", "assignee_id"],
+    "notices": ["id", "author_id"],
+    "schedules": ["id", "creator_id"],
+    "chat_messages": ["id", "user_id"],
+    "chat_summaries": ["user_id"],
+}
+
+BATCH_SIZE = 5000
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _alter_postgresql(postgresql.UUID(as_uuid=True), "{column}::uuid")
+    elif dialect == "sqlite":
+        _convert_sqlite(_to_bytes)
+        _alter_sqlite(sa.String(36), sa.LargeBinary(16))
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        _alter_postgresql(sa.String(36), "{column}::text")
+    elif dialect == "sqlite":
+        _convert_sqlite(_to_text)
+        _alter_sqlite(sa.LargeBinary(16), sa.String(36))
+
+
+def _to_bytes(value):
+    return value if isinstance(value, bytes) and len(value) == 16 else uuid.UUID(_as_str(value)).bytes
+
+
+def _to_text(value):
+    return str(uuid.UUID(bytes=value)) if isinstance(value, bytes) and len(value) == 16 else _as_str(value)
+
+
+def _as_str(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _alter_postgresql(type_, using: str):
+    """타입이 다른 FK는 공존할 수 없으므로 FK를 모두 내렸다가 변환 후 다시 건다"""
+    inspector = sa.inspect(op.get_bind())
+    foreign_keys = [
+        (table, fk)
+        for table in UUID_COLUMNS
+        for fk in inspector.get_foreign_keys(table)
+    ]
+    for table, fk in foreign_keys:
+        op.drop_constraint(fk["name"], table, type_="foreignkey")
+    for table, columns in UUID_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=type_, postgresql_using=using.format(column=f'"{column}"'))
+    for table, fk in foreign_keys:
+        op.create_foreign_key(
+            fk["name"], table, fk["referred_table"], fk["constrained_columns"], fk["referred_columns"]
+        )
+
+
+def _convert_sqlite(convert):
+    """행 단위 값 변환 (SQLite는 선언 타입과 무관하게 값을 저장하므로 타입 변경 전에 먼저 바꾼다)"""
+    conn = op.get_bind()
+    for table, columns in UUID_COLUMNS.items():
+        selected = ", ".join(f'"{c}"' for c in columns)
+        assignments = ", ".join(f'"{c}" = :{c}' for c in columns)
+        update = sa.text(f'UPDATE "{table}" SET {assignments} WHERE rowid = :_rowid')
+        rows = conn.execute(sa.text(f'SELECT rowid, {selected} FROM "{table}"')).all()
+        for start in range(0, len(rows), BATCH_SIZE):
+            params = [
+                {"_rowid": row[0], **{
+                    c: None if v is None else convert(v) for c, v in zip(columns, row[1:])
+                }}
+                for row in rows[start:start + BATCH_SIZE]
+            ]
+            conn.execute(update, params)
+
+
+def _alter_sqlite(existing_type, type_):
+    for table, columns in UUID_COLUMNS.items():
+        with op.batch_alter_table(table) as batch:
+            for column in columns:
+                batch.alter_column(column, existing_type=existing_type, type_=type_)
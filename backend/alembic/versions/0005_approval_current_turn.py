@@ -0,0 +1,65 @@
+"""approvals.current_step / current_approver_id (결재 대기함)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+
+결재 중인 문서의 현재 차례를 문서 행에 유지해 결재 대기함을 인덱스 한 번으로 조회한다.
+기존 결재 중 문서는 대기 중인 가장 앞 순서 결재라인으로 채운다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# 0004 이후의 UUIDType 저장 형식
+UUID = (
+    sa.String(36)
+    .with_variant(sa.LargeBinary(16), "sqlite")
+    .with_variant(postgresql.UUID(as_uuid=True), "postgresql")
+)
+
+
+def upgrade():
+    with op.batch_alter_table("approvals") as batch:
+        batch.add_column(sa.Column("current_step", sa.Integer(), nullable=True))
+        batch.add_column(sa.Column("current_approver_id", UUID, nullable=True))
+        batch.create_foreign_key(
+            "fk_approvals_current_approver_id_users", "users", ["current_approver_id"], ["id"]
+        )
+    op.create_index(
+        "ix_approvals_current_approver", "approvals", ["current_approver_id", "created_at", "id"]
+    )
+
+    op.execute(
+        """
+        UPDATE approvals SET current_step = (
+            SELECT MIN(approval_lines."order") FROM approval_lines
+            WHERE approval_lines.approval_id = approvals.id AND approval_lines.action = 'pending'
+        )
+        WHERE status = 'pending'
+        """
+    )
+    op.execute(
+        """
+        UPDATE approvals SET current_approver_id = (
+            SELECT approval_lines.approver_id FROM approval_lines
+            WHERE approval_lines.approval_id = approvals.id
+              AND approval_lines."order" = approvals.current_step
+        )
+        WHERE current_step IS NOT NULL
+        """
+    )
+
+
+def downgrade():
+    op.drop_index("ix_approvals_current_approver", table_name="approvals")
+    with op.batch_alter_table("approvals") as batch:
+        batch.drop_constraint("fk_approvals_current_approver_id_users", type_="foreignkey")
+        batch.drop_column("current_approver_id")
+        batch.drop_column("current_step")
@@ -0,0 +1,30 @@
+"""schedules (creator_id, start_time, end_time) 인덱스
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+
+기간 조회(from~to, 달력)와 일정 겹침 검사는 start_time < to AND end_time > from 조건이므로
+end_time까지 인덱스에 넣어 테이블을 읽지 않고 거른다. 같은 앞부분을 가진 (creator_id, start_time, id)를 대체한다.
+"""
+
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_schedules_creator_range", "schedules", ["creator_id", "start_time", "end_time"]
+    )
+    op.drop_index("ix_schedules_creator_start", table_name="schedules")
+
+
+def downgrade():
+    op.create_index(
+        "ix_schedules_creator_start", "schedules", ["creator_id", "start_time", "id"]
+    )
+    op.drop_index("ix_schedules_creator_range", table_name="schedules")
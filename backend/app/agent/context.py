@@ -0,0 +1,210 @@
+"""
+BAIKAL AI Agent - Context Window Manager
+토큰 예산에 맞춰 대화 기록을 자르고, 오래된 대화는 누적 요약으로 접는다.
+"""
+
+import math
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models import ChatSummary
+from app.agent.llm import llm_clients
+
+MESSAGE_OVERHEAD_TOKENS = 4  # role/구분자 등 메시지당 고정 토큰
+
+_encoding = None
+_encoding_loaded = False
+
+SUMMARY_PROMPT = """다음은 사용자와 AI 비서의 이전 대화입니다.
+이후 대화에 필요한 사실(요청 내용, 생성된 문서/업무/일정, 사용자 선호)만 한국어로 간결하게 요약하세요.
+{limit}토큰을 넘기지 마세요."""
+
+
+# ─── Token Counting ──────────────────────────────────
+
+def _get_encoding():
+    """tiktoken이 설치되어 있으면 사용 (없으면 추정치 사용)"""
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            _encoding = None
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """메시지 토큰 수 (tiktoken 또는 문자 수 기반 추정)"""
+    text = text or ""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text)) + MESSAGE_OVERHEAD_TOKENS
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    other_chars = len(text) - ascii_chars
+    # 영문은 약 4자/토큰, 한글은 약 1.5자/토큰
+    return math.ceil(ascii_chars / 4 + other_chars / 1.5) + MESSAGE_OVERHEAD_TOKENS
+
+
+def history_timestamp(value: datetime) -> str:
+    """캐시/비교용 created_at 문자열 (naive UTC ISO)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="microseconds")
+
+
+# ─── Summary Store ───────────────────────────────────
+
+class _SummaryCache:
+    """사용자별 요약 캐시 (LRU)"""
+
+    def __init__(self, max_users: int):
+        self.max_users = max_users
+        self._data: OrderedDict[str, Optional[dict]] = OrderedDict()
+
+    def get(self, user_id):
+        key = str(user_id)
+        if key not in self._data:
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def set(self, user_id, summary: Optional[dict]):
+        key = str(user_id)
+        self._data[key] = summary
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_users:
+            self._data.popitem(last=False)
+
+    def invalidate(self, user_id):
+        self._data.pop(str(user_id), None)
+
+
+summary_cache = _SummaryCache(settings.CHAT_HISTORY_MAX_USERS)
+
+
+async def get_summary(db: AsyncSession, user_id) -> Optional[dict]:
+    """저장된 누적 요약 조회 ({content, tokens, covered_until} 또는 None)"""
+    try:
+        return summary_cache.get(user_id)
+    except KeyError:
+        pass
+    result = await db.execute(select(ChatSummary).where(ChatSummary.user_id == user_id))
+    row = result.scalar_one_or_none()
+    summary = None
+    if row:
+        summary = {
+            "content": row.content,
+            "tokens": row.token_count,
+            "covered_until": history_timestamp(row.covered_until),
+        }
+    summary_cache.set(user_id, summary)
+    return summary
+
+
+async def _save_summary(db: AsyncSession, user_id, content: str, covered_until: str) -> dict:
+    result = await db.execute(select(ChatSummary).where(ChatSummary.user_id == user_id))
+    row = result.scalar_one_or_none()
+    if row is None:
+        row = ChatSummary(user_id=user_id)
+        db.add(row)
+    row.content = content
+    row.token_count = count_tokens(content)
+    row.covered_until = datetime.fromisoformat(covered_until)
+    await db.flush()
+
+    summary = {"content": content, "tokens": row.token_count, "covered_until": covered_until}
+    summary_cache.set(user_id, summary)
+    return summary
+
+
+# ─── Context Fitting ─────────────────────────────────
+
+async def fit_context(db: AsyncSession, user_id, history: list[dict]) -> tuple[Optional[str], list[dict]]:
+    """
+    대화 기록을 토큰 예산에 맞춘다.
+    - 요약에 이미 포함된 메시지는 제외
+    - 예산(CONTEXT_TOKEN_BUDGET) 또는 기록 개수 한도에 다다르면
+      최근 메시지를 예산의 절반까지만 남기고 나머지를 요약에 접는다
+    반환: (요약 텍스트 또는 None, 프롬프트에 넣을 메시지 목록)
+    """
+    budget = settings.CONTEXT_TOKEN_BUDGET
+    limit = settings.CHAT_HISTORY_LIMIT
+
+    summary = await get_summary(db, user_id)
+    if summary:
+        history = [m for m in history if m["created_at"] > summary["covered_until"]]
+
+    total = sum(m["tokens"] for m in history)
+    if total <= budget and len(history) < limit - 1:
+        return (summary["content"] if summary else None), history
+
+    # 최근 메시지부터 예산의 절반까지 유지
+    split = len(history)
+    kept_tokens = 0
+    while split > 0:
+        tokens = history[split - 1]["tokens"]
+        if kept_tokens + tokens > budget // 2 or len(history) - split >= limit // 2:
+            break
+        kept_tokens += tokens
+        split -= 1
+    to_fold, kept = history[:split], history[split:]
+    if not to_fold:
+        return (summary["content"] if summary else None), kept
+
+    content = await _summarize(summary["content"] if summary else None, to_fold)
+    summary = await _save_summary(db, user_id, content, to_fold[-1]["created_at"])
+    return summary["content"], kept
+
+
+async def _summarize(previous: Optional[str], messages: list[dict]) -> str:
+    """이전 요약 + 접을 메시지를 새 요약으로 (LLM 실패 시 발췌 요약)"""
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+    if previous:
+        transcript = f"[이전 요약]\n{previous}\n\n[대화]\n{transcript}"
+
+    try:
+        client, model = llm_clients.target()
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SUMMARY_PROMPT.format(limit=settings.CONTEXT_SUMMARY_TOKENS)},
+                {"role": "user", "content": transcript},
+            ],
+            temperature=0,
+            max_tokens=settings.CONTEXT_SUMMARY_TOKENS,
+        )
+        content = response.choices[0].message.content
+        if content:
+            return content.strip()
+    except Exception as e:
+        print(f"⚠️ Chat summary failed, using excerpts: {e!r}")
+
+    # Fallback: 메시지별 앞부분 발췌
+    # 이전 요약은 그보다 오래된 대화의 유일한 기록이므로 예산을 넘으면 오래된 발췌부터 버리고, 요약은 마지막에 자른다
+    excerpts = [f"- {m['role']}: {m['content'][:80]}" for m in messages]
+    content = "\n".join([previous, *excerpts] if previous else excerpts)
+    while count_tokens(content) > settings.CONTEXT_SUMMARY_TOKENS and len(excerpts) > (0 if previous else 1):
+        excerpts.pop(0)
+        content = "\n".join([previous, *excerpts] if previous else excerpts)
+    if previous and count_tokens(content) > settings.CONTEXT_SUMMARY_TOKENS:
+        content = _truncate(previous, settings.CONTEXT_SUMMARY_TOKENS)
+    return content
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    """토큰 예산에 맞게 뒷부분을 잘라냄"""
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
@@ -5,47 +5,31 @@ Function Calling + Tool Router + Context 관리
 """
 
 import json
-from typing import Optional
+import time
+from typing import AsyncIterator, Awaitable, Callable, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.config import settings
+from app.db.database import async_session
 from app.db.models import User, ChatMessage
-from app.agent.tools import TOOL_DEFINITIONS
+from app.agent.tool_index import ALL_TOOL_NAMES, select_tools, tool_subset
 from app.agent.executor import ToolExecutor
+from app.agent.llm import llm_clients
+from app.agent.memory import chat_history
+from app.agent.context import count_tokens, fit_context, history_timestamp, summary_cache
+from app.agent.prompt import build_messages, usage_summary
+from app.agent.response_cache import response_cache
+from app.agent.router import format_reply, route
 
-# System prompt for the AI Agent
-SYSTEM_PROMPT = """당신은 BAIKAL Groupware AI의 AI 비서입니다.
-당신의 이름은 'BAIKAL AI'입니다.
-
-당신은 사용자의 업무를 도와주는 AI Agent입니다.
-다음 작업을 수행할 수 있습니다:
-
-1. **전자결재** - 결재 문서 생성 (출장, 휴가, 구매 등)
-2. **업무관리** - 업무 생성 및 할당
-3. **일정관리** - 일정 등록
-4. **공지사항** - 공지사항 작성
-5. **사용자 검색** - 사용자 검색
-6. **데이터 조회** - 결재, 업무, 일정, 공지 조회
-
-규칙:
-- 사용자의 요청을 정확히 파악하고 적절한 도구를 사용하세요.
-- 결재 문서를 생성할 때는 적절한 제목과 내용을 작성하세요.
-- 날짜/시간이 필요한 경우, 현재 날짜를 기준으로 합리적인 값을 설정하세요.
-- 친절하고 전문적으로 응답하세요.
-- 한국어로 응답하세요.
-- 작업 완료 후 결과를 명확하게 안내하세요.
-
-현재 사용자 정보:
-- 이름: {user_name}
-- 부서: {user_department}
-- 직급: {user_position}
-- 현재 시간: {current_time}
-"""
 
+async def get_chat_history(db: AsyncSession, user_id, limit: int = None) -> list[dict]:
+    """최근 대화 기록 조회 (캐시 우선, 없으면 DB에서 채움)"""
+    limit = limit or settings.CHAT_HISTORY_LIMIT
+    cached = await chat_history.get(user_id)
+    if cached is not None:
+        return cached[-limit:]
 
-async def get_chat_history(db: AsyncSession, user_id, limit: int = 20) -> list[dict]:
-    """최근 대화 기록 조회"""
     result = await db.execute(
         select(ChatMessage)
         .where(ChatMessage.user_id == user_id)
@@ -55,20 +39,32 @@ async def get_chat_history(db: AsyncSession, user_id, limit: int = 20) -> list[d
     messages = list(reversed(result.scalars().all()))
     history = []
     for msg in messages:
-        history.append({"role": msg.role, "content": msg.content})
+        history.append(_history_entry(msg))
+    await chat_history.set(user_id, history)
     return history
 
 
+def _history_entry(msg: ChatMessage) -> dict:
+    return {
+        "role": msg.role,
+        "content": msg.content,
+        "tokens": msg.token_count if msg.token_count is not None else count_tokens(msg.content),
+        "created_at": history_timestamp(msg.created_at),
+    }
+
+
 async def save_chat_message(db: AsyncSession, user_id, role: str, content: str, tool_calls: str = None):
-    """대화 기록 저장"""
+    """대화 기록 저장 (캐시에도 추가)"""
     msg = ChatMessage(
         user_id=user_id,
         role=role,
         content=content,
         tool_calls=tool_calls,
+        token_count=count_tokens(content),
     )
     db.add(msg)
     await db.flush()
+    await chat_history.append(user_id, _history_entry(msg))
 
 
 async def run_agent(
@@ -79,180 +75,341 @@ async def run_agent(
     """
     AI Agent 실행 메인 함수
     1. 사용자 메시지 + 히스토리로 LLM 호출
-    2. Function Calling 감지
-    3. Tool 실행
+    2. Function Calling 감지 → Tool 실행 → 다시 LLM 호출 (최대 AGENT_MAX_STEPS회)
+    3. 도구 호출 없이 응답하면 종료
     4. 결과 반환
     """
-    from datetime import datetime, timezone
-
     executor = ToolExecutor(db, current_user)
-    
-    # Build system prompt
-    system_prompt = SYSTEM_PROMPT.format(
-        user_name=current_user.name,
-        user_department=current_user.department or "미지정",
-        user_position=current_user.position or "미지정",
-        current_time=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
-    )
 
-    # Get chat history
-    history = await get_chat_history(db, current_user.id)
+    try:
+        versions = response_cache.snapshot()
+
+        # Get chat history, trimmed to the context token budget (LLM 없이 처리하는 턴에도 요약을 갱신)
+        history = await get_chat_history(db, current_user.id)
+        summary, history = await fit_context(db, current_user.id, history)
+
+        # Save user message
+        await save_chat_message(db, current_user.id, "user", message)
+
+        # Simple list request or repeated read-only question → no LLM call
+        result = await _shortcut_result(current_user.id, message, executor.execute_many)
+        if result is None:
+            # Build messages
+            messages = build_messages(current_user, summary, history, message)
+
+            # Run agent loop
+            tool_names = _select_tools(message)
+            async for event in _agent_loop(messages, tool_names, executor.execute_many, stream=False):
+                if event["type"] == "done":
+                    result = event
+            _remember(current_user.id, message, result, versions)
+
+        # Save assistant message
+        tool_results = result["tool_results"]
+        tool_calls_json = json.dumps(tool_results, ensure_ascii=False) if tool_results else None
+        await save_chat_message(db, current_user.id, "assistant", result["reply"], tool_calls_json)
+    except Exception:
+        # 요청 트랜잭션이 롤백되므로 캐시에 추가된 메시지/요약도 버린다
+        await chat_history.invalidate(current_user.id)
+        summary_cache.invalidate(current_user.id)
+        raise
 
-    # Build messages
-    messages = [{"role": "system", "content": system_prompt}]
-    messages.extend(history)
-    messages.append({"role": "user", "content": message})
+    return {
+        "reply": result["reply"],
+        "tool_results": tool_results if tool_results else None,
+        "steps": result["steps"],
+        "usage": result["usage"],
+    }
 
-    # Save user message
-    await save_chat_message(db, current_user.id, "user", message)
 
-    # Call LLM
-    tool_results = []
-    
-    if settings.LLM_PROVIDER == "openai":
-        reply, tool_results = await _call_openai(messages, executor)
+async def stream_agent(message: str, current_user: User) -> AsyncIterator[dict]:
+    """
+    스트리밍 AI Agent 실행
+    LLM 토큰, Tool 실행 시작/완료, 단계별 타이밍, 최종 결과를 이벤트로 순차 전달한다.
+    DB 세션은 히스토리 조회, Tool 실행, 기록 저장 구간에서만 짧게 사용한다.
+    """
+    async def run_tools(calls: list[tuple[str, dict]]) -> list[dict]:
+        async with async_session() as db:
+            results = await ToolExecutor(db, current_user).execute_many(calls)
+            await db.commit()
+        return results
+
+    versions = response_cache.snapshot()
+    async with async_session() as db:
+        history = await get_chat_history(db, current_user.id)
+        summary, history = await fit_context(db, current_user.id, history)
+        await save_chat_message(db, current_user.id, "user", message)
+        await db.commit()
+
+    result = await _shortcut_result(current_user.id, message, run_tools)
+    if result is not None:
+        yield {"type": "token", "content": result["reply"]}
     else:
-        reply, tool_results = await _call_ollama(messages, executor)
+        messages = build_messages(current_user, summary, history, message)
+
+        async for event in _agent_loop(messages, _select_tools(message), run_tools, stream=True):
+            if event["type"] == "done":
+                result = event
+            else:
+                yield event
+        _remember(current_user.id, message, result, versions)
 
-    # Save assistant message
+    tool_results = result["tool_results"]
     tool_calls_json = json.dumps(tool_results, ensure_ascii=False) if tool_results else None
-    await save_chat_message(db, current_user.id, "assistant", reply, tool_calls_json)
+    async with async_session() as db:
+        await save_chat_message(db, current_user.id, "assistant", result["reply"], tool_calls_json)
+        await db.commit()
 
-    return {
-        "reply": reply,
+    yield {
+        "type": "done",
+        "reply": result["reply"],
         "tool_results": tool_results if tool_results else None,
+        "steps": result["steps"],
+        "usage": result["usage"],
     }
 
 
-async def _call_openai(messages: list[dict], executor: ToolExecutor) -> tuple[str, list]:
-    """OpenAI API 호출 (Function Calling 지원)"""
-    from openai import AsyncOpenAI
+# ─── LLM Shortcuts ────────────────────────────────────
 
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-    
-    response = await client.chat.completions.create(
-        model=settings.OPENAI_MODEL,
-        messages=messages,
-        tools=TOOL_DEFINITIONS,
-        tool_choice="auto",
-        temperature=0.7,
-    )
+async def _shortcut_result(
+    user_id,
+    message: str,
+    run_tools: Callable[[list[tuple[str, dict]]], Awaitable[list[dict]]],
+) -> Optional[dict]:
+    """LLM 없이 처리 가능한 턴: 의도 라우터 → 응답 캐시 순으로 시도"""
+    result = await _routed_result(message, run_tools)
+    if result is None:
+        result = _cached_result(user_id, message)
+    return result
 
-    assistant_message = response.choices[0].message
-    tool_results = []
 
-    # Handle tool calls
-    if assistant_message.tool_calls:
-        # Add assistant message with tool calls to messages
-        messages.append({
-            "role": "assistant",
-            "content": assistant_message.content or "",
-            "tool_calls": [
-                {
-                    "id": tc.id,
-                    "type": "function",
-                    "function": {
-                        "name": tc.function.name,
-                        "arguments": tc.function.arguments,
-                    }
-                }
-                for tc in assistant_message.tool_calls
-            ]
-        })
+async def _routed_result(
+    message: str,
+    run_tools: Callable[[list[tuple[str, dict]]], Awaitable[list[dict]]],
+) -> Optional[dict]:
+    """의도 라우터가 확신하는 단순 조회는 도구를 직접 실행하고 템플릿으로 응답"""
+    if not settings.INTENT_ROUTER_ENABLED:
+        return None
+    tool_name = route(message)
+    if tool_name is None:
+        return None
+
+    started = time.perf_counter()
+    result = (await run_tools([(tool_name, {})]))[0]
+    if not result.get("success"):
+        return None
+    tool_ms = int((time.perf_counter() - started) * 1000)
+    return {
+        "reply": format_reply(tool_name, result),
+        "tool_results": [result],
+        "steps": [{"step": 1, "llm_ms": 0, "tool_ms": tool_ms, "tools": [tool_name], "tokens": 0, "cached_tokens": 0}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0},
+    }
 
-        # Execute each tool
-        for tool_call in assistant_message.tool_calls:
-            func_name = tool_call.function.name
-            func_args = json.loads(tool_call.function.arguments)
-            
-            result = await executor.execute(func_name, func_args)
-            tool_results.append(result)
 
-            messages.append({
-                "role": "tool",
-                "tool_call_id": tool_call.id,
-                "content": json.dumps(result, ensure_ascii=False),
-            })
+def _cached_result(user_id, message: str) -> Optional[dict]:
+    """캐시된 조회 응답을 에이전트 루프 결과 형태로 반환"""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return None
+    cached = response_cache.lookup(user_id, message)
+    if cached is None:
+        return None
+    return {
+        "reply": cached["reply"],
+        "tool_results": cached["tool_results"],
+        "steps": [],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0},
+    }
 
-        # Get final response with tool results
-        final_response = await client.chat.completions.create(
-            model=settings.OPENAI_MODEL,
-            messages=messages,
-            temperature=0.7,
-        )
-        reply = final_response.choices[0].message.content or ""
-    else:
-        reply = assistant_message.content or ""
 
-    return reply, tool_results
+def _remember(user_id, message: str, result: dict, versions: dict):
+    if settings.RESPONSE_CACHE_ENABLED:
+        tool_names = [name for step in result["steps"] for name in step["tools"]]
+        response_cache.store(user_id, message, result["reply"], result["tool_results"], tool_names, versions)
 
 
-async def _call_ollama(messages: list[dict], executor: ToolExecutor) -> tuple[str, list]:
-    """Ollama API 호출 (OpenAI 호환 API 사용)"""
-    from openai import AsyncOpenAI
+# ─── Agent Loop ───────────────────────────────────────
 
-    client = AsyncOpenAI(
-        base_url=f"{settings.OLLAMA_BASE_URL}/v1",
-        api_key="ollama",
-    )
+def _select_tools(message: str) -> tuple[str, ...]:
+    # OpenAI 프롬프트 캐시는 도구 목록까지 prefix로 보므로 매 턴 같은 전체 목록을 보낸다
+    if not settings.AGENT_TOOL_SELECTION_ENABLED or settings.LLM_PROVIDER == "openai":
+        return ALL_TOOL_NAMES
+    return select_tools(message)
 
-    try:
-        response = await client.chat.completions.create(
-            model=settings.OLLAMA_MODEL,
-            messages=messages,
-            tools=TOOL_DEFINITIONS,
-            tool_choice="auto",
-            temperature=0.7,
-        )
-    except Exception:
-        # Fallback without tools if Ollama doesn't support function calling
-        response = await client.chat.completions.create(
-            model=settings.OLLAMA_MODEL,
-            messages=messages,
-            temperature=0.7,
-        )
-        return response.choices[0].message.content or "", []
-
-    assistant_message = response.choices[0].message
+
+async def _agent_loop(
+    messages: list[dict],
+    tool_names: tuple[str, ...],
+    run_tools: Callable[[list[tuple[str, dict]]], Awaitable[list[dict]]],
+    stream: bool,
+) -> AsyncIterator[dict]:
+    """
+    Tool 호출 → 실행 → 재호출 루프
+    - 한 단계에서 반환된 여러 tool_calls는 run_tools가 한 번에(가능하면 동시에) 실행
+    - 도구 호출 없는 응답이 나오면 조기 종료
+    - 마지막 단계이거나 토큰/시간 예산을 넘으면 tools 없이 호출해 최종 응답을 강제
+    - messages 버퍼는 단계 간에 그대로 이어 붙여 재사용
+    - 첫 단계는 tool_names만 보내고, 이후 단계는 전체 도구 (도구 결과를 보고 고르지 않은 도구가 필요해질 수 있다)
+    """
+    client, model = llm_clients.target()
+    tools_enabled = True
+    deadline = time.monotonic() + settings.AGENT_TURN_TIMEOUT
+    tokens_used = 0
+    usage = {"prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0}
     tool_results = []
+    steps = []
+    reply = ""
+
+    for step in range(1, settings.AGENT_MAX_STEPS + 1):
+        over_budget = tokens_used >= settings.AGENT_TOKEN_BUDGET or time.monotonic() >= deadline
+        tool_defs, tool_tokens = tool_subset(tool_names if step == 1 else ALL_TOOL_NAMES)
+        tools = tool_defs if tools_enabled and step < settings.AGENT_MAX_STEPS and not over_budget else None
+
+        llm_started = time.perf_counter()
+        completion = None
+        emitted = False
+        try:
+            async for kind, value in _complete(client, model, messages, tools, stream):
+                if kind == "token":
+                    emitted = True
+                    yield {"type": "token", "content": value}
+                else:
+                    completion = value
+        except Exception:
+            # 이미 토큰을 보냈으면 다시 호출하면 응답이 중복되므로 오류로 끝낸다 (스트림에는 error 이벤트)
+            if settings.LLM_PROVIDER == "openai" or not tools or emitted:
+                raise
+            # Fallback without tools if Ollama doesn't support function calling
+            tools_enabled = False
+            async for kind, value in _complete(client, model, messages, None, stream):
+                if kind == "token":
+                    yield {"type": "token", "content": value}
+                else:
+                    completion = value
+        llm_ms = int((time.perf_counter() - llm_started) * 1000)
+
+        content, calls, raw_usage = completion
+        step_usage = usage_summary(raw_usage)
+        llm_clients.record_usage(step_usage)
+        for key, value in step_usage.items():
+            usage[key] += value
+        tokens_used = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        if not calls:
+            reply = content
+            steps.append({
+                "step": step,
+                "llm_ms": llm_ms,
+                "tool_ms": 0,
+                "tools": [],
+                "tokens": tokens_used,
+                "cached_tokens": step_usage["cached_tokens"],
+                "tool_schema_tokens": tool_tokens if tools else 0,
+            })
+            yield {"type": "step", **steps[-1]}
+            break
 
-    if hasattr(assistant_message, 'tool_calls') and assistant_message.tool_calls:
         messages.append({
             "role": "assistant",
-            "content": assistant_message.content or "",
+            "content": content,
             "tool_calls": [
                 {
-                    "id": tc.id,
+                    "id": call["id"],
                     "type": "function",
-                    "function": {
-                        "name": tc.function.name,
-                        "arguments": tc.function.arguments,
-                    }
+                    "function": {"name": call["name"], "arguments": call["arguments"]},
                 }
-                for tc in assistant_message.tool_calls
+                for call in calls
             ]
         })
 
-        for tool_call in assistant_message.tool_calls:
-            func_name = tool_call.function.name
-            func_args = json.loads(tool_call.function.arguments)
-            
-            result = await executor.execute(func_name, func_args)
-            tool_results.append(result)
+        parsed = [_parse_arguments(call["arguments"]) for call in calls]
+        for call, func_args in zip(calls, parsed):
+            yield {"type": "tool_call_start", "id": call["id"], "name": call["name"], "arguments": func_args or {}}
+
+        # 인자 JSON이 깨진 호출은 실행하지 않고 오류 결과를 돌려줘 다음 단계에서 다시 호출하게 한다
+        valid = [idx for idx, func_args in enumerate(parsed) if func_args is not None]
+        results = [{"error": "invalid arguments JSON"} for _ in calls]
+        tool_started = time.perf_counter()
+        if valid:
+            for idx, result in zip(valid, await run_tools([(calls[idx]["name"], parsed[idx]) for idx in valid])):
+                results[idx] = result
+        tool_ms = int((time.perf_counter() - tool_started) * 1000)
 
+        for call, result in zip(calls, results):
+            tool_results.append(result)
+            yield {"type": "tool_call_end", "id": call["id"], "name": call["name"], "result": result}
             messages.append({
                 "role": "tool",
-                "tool_call_id": tool_call.id,
+                "tool_call_id": call["id"],
                 "content": json.dumps(result, ensure_ascii=False),
             })
 
-        final_response = await client.chat.completions.create(
-            model=settings.OLLAMA_MODEL,
-            messages=messages,
-            temperature=0.7,
-        )
-        reply = final_response.choices[0].message.content or ""
-    else:
-        reply = assistant_message.content or ""
+        steps.append({
+            "step": step,
+            "llm_ms": llm_ms,
+            "tool_ms": tool_ms,
+            "tools": [call["name"] for call in calls],
+            "tokens": tokens_used,
+            "cached_tokens": step_usage["cached_tokens"],
+            "tool_schema_tokens": tool_tokens if tools else 0,
+        })
+        yield {"type": "step", **steps[-1]}
+
+    yield {"type": "done", "reply": reply, "tool_results": tool_results, "steps": steps, "usage": usage}
 
-    return reply, tool_results
+
+def _parse_arguments(arguments: str) -> Optional[dict]:
+    """모델이 만든 tool 인자 JSON 파싱 (잘렸거나 객체가 아니면 None)"""
+    try:
+        value = json.loads(arguments or "{}")
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+async def _complete(client, model: str, messages: list[dict], tools: Optional[list], stream: bool):
+    """
+    LLM 1회 호출
+    stream이면 ("token", str)을 먼저 생성하고, 마지막에 ("message", (content, tool_calls, usage))를 생성
+    """
+    kwargs = {"model": model, "messages": messages, "temperature": 0.7}
+    if tools:
+        kwargs["tools"] = tools
+        kwargs["tool_choice"] = "auto"
+
+    if not stream:
+        response = await client.chat.completions.create(**kwargs)
+        message = response.choices[0].message
+        calls = [
+            {"id": tc.id, "name": tc.function.name, "arguments": tc.function.arguments}
+            for tc in getattr(message, "tool_calls", None) or []
+        ]
+        yield "message", (message.content or "", calls, response.usage)
+        return
+
+    kwargs["stream"] = True
+    if settings.LLM_PROVIDER == "openai":
+        kwargs["stream_options"] = {"include_usage": True}
+
+    parts = []
+    calls: dict[int, dict] = {}
+    usage = None
+    response = await client.chat.completions.create(**kwargs)
+    async for chunk in response:
+        if getattr(chunk, "usage", None):
+            usage = chunk.usage
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        if delta.content:
+            parts.append(delta.content)
+            yield "token", delta.content
+        for tc in delta.tool_calls or []:
+            call = calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+            if tc.id:
+                call["id"] = tc.id
+            if tc.function and tc.function.name:
+                call["name"] += tc.function.name
+            if tc.function and tc.function.arguments:
+                call["arguments"] += tc.function.arguments
+    yield "message", ("".join(parts), [calls[idx] for idx in sorted(calls)], usage)
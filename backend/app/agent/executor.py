@@ -3,13 +3,20 @@ BAIKAL AI Agent - Tool Executor
 실제 DB 작업을 수행하는 도구 실행기
 """
 
+import asyncio
 import json
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 
+from app.core.events import notify_approval, notify_task, notify_schedule, notify_notice
+from app.db.database import async_session
+from app.db.schedule_range import validate_span, overlapping, find_conflicts
+from app.db.user_directory import user_directory
+from app.agent.tools import READ_ONLY_TOOLS, TOOL_RESOURCES
+from app.agent.user_index import user_index, best_match
 from app.db.models import (
     User, Approval, ApprovalLine, ApprovalLog,
     Task, Notice, Schedule, ChatMessage,
@@ -31,19 +38,58 @@ class ToolExecutor:
         except Exception as e:
             return {"error": str(e)}
 
+    async def execute_many(self, calls: list[tuple[str, dict]]) -> list[dict]:
+        """
+        여러 도구 호출을 의존성에 맞춰 실행하고 호출 순서대로 결과를 반환
+        - 앞선 변경 도구와 대상이 겹치지 않는 조회 도구: 각자 별도 세션에서 동시 실행
+        - 변경 도구 및 그 결과에 의존하는 조회 도구: 요청 트랜잭션에서 순서대로 실행
+        """
+        results: list[dict] = [None] * len(calls)
+        isolated, sequential = [], []
+        written = set()
+        for idx, (tool_name, _) in enumerate(calls):
+            resource = TOOL_RESOURCES.get(tool_name)
+            if tool_name in READ_ONLY_TOOLS and resource not in written:
+                isolated.append(idx)
+            else:
+                sequential.append(idx)
+                if tool_name not in READ_ONLY_TOOLS:
+                    written.add(resource)
+
+        async def run_isolated(idx: int):
+            results[idx] = await self._execute_isolated(*calls[idx])
+
+        async def run_sequential():
+            for idx in sequential:
+                results[idx] = await self.execute(*calls[idx])
+
+        if len(isolated) + bool(sequential) > 1:
+            await asyncio.gather(run_sequential(), *(run_isolated(idx) for idx in isolated))
+        else:
+            # 단일 호출은 별도 세션 없이 요청 세션에서 실행
+            for idx in isolated + sequential:
+                results[idx] = await self.execute(*calls[idx])
+        return results
+
+    async def _execute_isolated(self, tool_name: str, arguments: dict) -> dict:
+        """조회 도구를 독립 세션에서 실행"""
+        async with async_session() as db:
+            return await ToolExecutor(db, self.current_user).execute(tool_name, arguments)
+
     # ─── create_approval ──────────────────────────────
     async def _handle_create_approval(self, args: dict) -> dict:
         approver_names = args.get("approver_names", [])
-        approver_ids = []
 
-        # 이름으로 결재자 검색
+        # 이름으로 결재자 검색 (색인에서 한 번에 해석, 동명이인/미확인은 후보와 함께 보고)
+        matches = await user_index.resolve_many(self.db, approver_names)
+        approvers = []
+        unresolved = []
         for name in approver_names:
-            result = await self.db.execute(
-                select(User).where(User.name.ilike(f"%{name}%"))
-            )
-            user = result.scalar_one_or_none()
+            user = best_match(matches[name])
             if user:
-                approver_ids.append(user.id)
+                approvers.append(user)
+            else:
+                unresolved.append({"name": name, "candidates": [m.user.brief() for m in matches[name]]})
 
         approval = Approval(
             title=args["title"],
@@ -55,10 +101,10 @@ class ToolExecutor:
         self.db.add(approval)
         await self.db.flush()
 
-        for idx, aid in enumerate(approver_ids):
+        for idx, approver in enumerate(approvers):
             line = ApprovalLine(
                 approval_id=approval.id,
-                approver_id=aid,
+                approver_id=approver.id,
                 order=idx + 1,
                 action="pending",
             )
@@ -72,10 +118,18 @@ class ToolExecutor:
         )
         self.db.add(log)
         await self.db.flush()
+        notify_approval(self.db, "approval.created", approval)
 
-        approver_info = []
-        for name in approver_names:
-            approver_info.append(name)
+        approver_info = [a.name for a in approvers]
+        message = f"결재문서 '{approval.title}'이(가) 초안으로 생성되었습니다." + (
+            f" 결재라인: {' → '.join(approver_info)}" if approver_info else " 결재라인을 추가해주세요."
+        )
+        for item in unresolved:
+            if item["candidates"]:
+                names = ", ".join(f"{c['name']}({c['department']})" for c in item["candidates"])
+                message += f" '{item['name']}'과(와) 일치하는 사용자가 여러 명입니다: {names}"
+            else:
+                message += f" '{item['name']}' 사용자를 찾을 수 없어 결재라인에서 제외했습니다."
 
         return {
             "success": True,
@@ -87,9 +141,8 @@ class ToolExecutor:
                 "category": approval.category,
                 "status": approval.status,
                 "approvers": approver_info,
-                "message": f"결재문서 '{approval.title}'이(가) 초안으로 생성되었습니다." + (
-                    f" 결재라인: {' → '.join(approver_info)}" if approver_info else " 결재라인을 추가해주세요."
-                ),
+                "unresolved": unresolved,
+                "message": message,
             }
         }
 
@@ -99,10 +152,18 @@ class ToolExecutor:
         assignee_name = args.get("assignee_name")
 
         if assignee_name:
-            result = await self.db.execute(
-                select(User).where(User.name.ilike(f"%{assignee_name}%"))
-            )
-            assignee = result.scalar_one_or_none()
+            matches = (await user_index.resolve_many(self.db, [assignee_name]))[assignee_name]
+            assignee = best_match(matches)
+            if assignee is None and matches:
+                # 동명이인: 임의로 고르지 않고 후보를 돌려준다
+                return {
+                    "success": False,
+                    "type": "users",
+                    "data": {
+                        "users": [m.user.brief() for m in matches],
+                        "message": f"'{assignee_name}'과(와) 일치하는 사용자가 여러 명입니다. 담당자를 지정해주세요.",
+                    }
+                }
             if assignee:
                 assignee_id = assignee.id
                 assignee_name = assignee.name
@@ -132,6 +193,7 @@ class ToolExecutor:
         )
         self.db.add(task)
         await self.db.flush()
+        notify_task(self.db, "task.created", task)
 
         return {
             "success": True,
@@ -155,6 +217,24 @@ class ToolExecutor:
             start_time = start_time.replace(tzinfo=timezone.utc)
         if end_time.tzinfo is None:
             end_time = end_time.replace(tzinfo=timezone.utc)
+        validate_span(start_time, end_time)
+
+        # 에이전트가 만든 회의가 기존 일정과 겹치지 않게 (사용자가 겹쳐도 된다고 하면 allow_conflict)
+        if not args.get("allow_conflict"):
+            conflicts = await find_conflicts(self.db, self.current_user.id, start_time, end_time)
+            if conflicts:
+                return {
+                    "success": False,
+                    "type": "schedules",
+                    "data": {
+                        "schedules": [
+                            {"id": str(s.id), "title": s.title, "start_time": str(s.start_time), "end_time": str(s.end_time)}
+                            for s in conflicts
+                        ],
+                        "message": f"같은 시간에 겹치는 일정이 {len(conflicts)}건 있어 등록하지 않았습니다. "
+                                   "그래도 등록하려면 겹쳐도 된다고 알려주세요.",
+                    }
+                }
 
         schedule = Schedule(
             title=args["title"],
@@ -166,6 +246,7 @@ class ToolExecutor:
         )
         self.db.add(schedule)
         await self.db.flush()
+        notify_schedule(self.db, "schedule.created", schedule)
 
         return {
             "success": True,
@@ -190,6 +271,7 @@ class ToolExecutor:
         )
         self.db.add(notice)
         await self.db.flush()
+        notify_notice(self.db, "notice.created", notice)
 
         return {
             "success": True,
@@ -205,18 +287,13 @@ class ToolExecutor:
     # ─── search_users ────────────────────────────────
     async def _handle_search_users(self, args: dict) -> dict:
         name = args.get("name", "")
-        result = await self.db.execute(
-            select(User).where(User.name.ilike(f"%{name}%"), User.is_active == True)
-        )
-        users = result.scalars().all()
+        await user_index.ensure_fresh(self.db)
+        users = [m.user for m in user_index.search(name, limit=50)]
         return {
             "success": True,
             "type": "users",
             "data": {
-                "users": [
-                    {"id": str(u.id), "name": u.name, "department": u.department, "position": u.position}
-                    for u in users
-                ],
+                "users": [u.brief() for u in users],
                 "message": f"{len(users)}명의 사용자를 찾았습니다." if users else f"'{name}' 사용자를 찾을 수 없습니다.",
             }
         }
@@ -267,10 +344,13 @@ class ToolExecutor:
 
     # ─── list_my_schedules ────────────────────────────
     async def _handle_list_my_schedules(self, args: dict) -> dict:
+        # 기본은 지금 이후(진행 중 포함) 다가오는 일정, 기간을 주면 그 기간과 겹치는 일정
+        start = _parse_datetime(args.get("from")) or datetime.now(timezone.utc)
+        end = _parse_datetime(args.get("to"))
         result = await self.db.execute(
             select(Schedule)
-            .where(Schedule.creator_id == self.current_user.id)
-            .order_by(Schedule.start_time.desc())
+            .where(Schedule.creator_id == self.current_user.id, *overlapping(start, end))
+            .order_by(Schedule.start_time, Schedule.id)
             .limit(10)
         )
         schedules = result.scalars().all()
@@ -290,19 +370,30 @@ class ToolExecutor:
     async def _handle_list_notices(self, args: dict) -> dict:
         result = await self.db.execute(
             select(Notice)
-            .options(selectinload(Notice.author))
             .order_by(Notice.is_pinned.desc(), Notice.created_at.desc())
             .limit(10)
         )
         notices = result.scalars().all()
+        users = await user_directory.briefs(self.db, [n.author_id for n in notices])
         return {
             "success": True,
             "type": "notices",
             "data": {
                 "notices": [
-                    {"id": str(n.id), "title": n.title, "author": n.author.name, "created_at": str(n.created_at)}
+                    {"id": str(n.id), "title": n.title, "author": users[n.author_id]["name"], "created_at": str(n.created_at)}
                     for n in notices
                 ],
                 "message": f"{len(notices)}건의 공지사항이 있습니다.",
             }
         }
+
+
+def _parse_datetime(value) -> Optional[datetime]:
+    """ISO 8601 문자열 → datetime (시간대가 없으면 UTC), 비었거나 형식이 틀리면 None"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
@@ -0,0 +1,206 @@
+"""
+BAIKAL AI Agent - LLM Client Registry
+프로세스 전역 LLM 클라이언트 관리 (커넥션 풀 공유 + 풀 사용량 지표)
+"""
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.core.config import settings
+
+try:
+    import h2  # noqa: F401  (HTTP/2 지원 여부 확인)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+class _PoolStats:
+    """LLM HTTP 풀 사용량 집계"""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests_total = 0
+        self.saturated_total = 0
+        self.errors_total = 0
+
+    def started(self):
+        if self.in_flight >= self.max_connections:
+            # 요청 시작 시점에 모든 커넥션이 사용 중 → 풀 대기 발생
+            self.saturated_total += 1
+        self.in_flight += 1
+        self.requests_total += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self, error: bool = False):
+        self.in_flight -= 1
+        if error:
+            self.errors_total += 1
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    """응답 본문이 닫힐 때 요청 종료를 기록하는 스트림 래퍼"""
+
+    def __init__(self, inner: httpx.AsyncByteStream, stats: _PoolStats):
+        self._inner = inner
+        self._stats = stats
+        self._closed = False
+
+    async def __aiter__(self):
+        async for chunk in self._inner:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._inner.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._stats.finished()
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    """요청 시작~응답 종료 구간을 커넥션 점유로 집계하는 트랜스포트"""
+
+    def __init__(self, inner: httpx.AsyncHTTPTransport, stats: _PoolStats):
+        self._inner = inner
+        self._stats = stats
+
+    @property
+    def open_connections(self) -> int:
+        pool = getattr(self._inner, "_pool", None)
+        return len(getattr(pool, "connections", []))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._stats.started()
+        try:
+            response = await self._inner.handle_async_request(request)
+        except Exception:
+            self._stats.finished(error=True)
+            raise
+        if response.is_closed:
+            # 본문이 이미 모두 읽힌 응답
+            self._stats.finished()
+            return response
+        response.stream = _MeteredStream(response.stream, self._stats)
+        return response
+
+    async def aclose(self):
+        await self._inner.aclose()
+
+
+class LLMClientRegistry:
+    """Provider별 AsyncOpenAI 클라이언트를 한 번만 만들어 모든 요청이 공유"""
+
+    def __init__(self):
+        self._clients: dict[str, AsyncOpenAI] = {}
+        self._transports: dict[str, _MeteredTransport] = {}
+        self._stats: dict[str, _PoolStats] = {}
+        self._usage = {"prompt_tokens": 0, "cached_tokens": 0}
+
+    def _provider_options(self, provider: str) -> dict:
+        if provider == "openai":
+            return {
+                "base_url": None,
+                "api_key": settings.OPENAI_API_KEY,
+                "timeout": settings.OPENAI_TIMEOUT,
+            }
+        if provider == "ollama":
+            return {
+                "base_url": f"{settings.OLLAMA_BASE_URL}/v1",
+                "api_key": "ollama",
+                "timeout": settings.OLLAMA_TIMEOUT,
+            }
+        raise ValueError(f"Unknown LLM provider: {provider}")
+
+    @staticmethod
+    def is_configured(provider: str = None) -> bool:
+        """Provider 사용에 필요한 설정이 있는지 (openai는 API 키)"""
+        provider = provider or settings.LLM_PROVIDER
+        return provider != "openai" or bool(settings.OPENAI_API_KEY)
+
+    def _build(self, provider: str) -> AsyncOpenAI:
+        if not self.is_configured(provider):
+            raise RuntimeError("OPENAI_API_KEY is not configured")
+        options = self._provider_options(provider)
+        timeout = httpx.Timeout(options["timeout"], connect=settings.LLM_CONNECT_TIMEOUT)
+        limits = httpx.Limits(
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY,
+        )
+        stats = _PoolStats(settings.LLM_MAX_CONNECTIONS)
+        transport = _MeteredTransport(
+            httpx.AsyncHTTPTransport(
+                http2=settings.LLM_HTTP2 and _HTTP2_AVAILABLE,
+                limits=limits,
+            ),
+            stats,
+        )
+        http_client = httpx.AsyncClient(transport=transport, timeout=timeout)
+
+        self._transports[provider] = transport
+        self._stats[provider] = stats
+        return AsyncOpenAI(
+            base_url=options["base_url"],
+            api_key=options["api_key"],
+            timeout=timeout,
+            http_client=http_client,
+        )
+
+    def get(self, provider: str = None) -> AsyncOpenAI:
+        """공유 클라이언트 반환 (없으면 생성, 설정이 없으면 RuntimeError)"""
+        provider = provider or settings.LLM_PROVIDER
+        client = self._clients.get(provider)
+        if client is None:
+            client = self._build(provider)
+            self._clients[provider] = client
+        return client
+
+    def target(self) -> tuple[AsyncOpenAI, str]:
+        """현재 Provider의 (클라이언트, 모델) 반환"""
+        if settings.LLM_PROVIDER == "openai":
+            return self.get("openai"), settings.OPENAI_MODEL
+        return self.get("ollama"), settings.OLLAMA_MODEL
+
+    def record_usage(self, usage: dict):
+        """프롬프트 캐시 적중률 집계"""
+        self._usage["prompt_tokens"] += usage["prompt_tokens"]
+        self._usage["cached_tokens"] += usage["cached_tokens"]
+
+    async def aclose(self):
+        """모든 클라이언트와 커넥션 풀 종료"""
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
+        self._transports.clear()
+        self._stats.clear()
+
+    def prompt_cache_metrics(self) -> dict:
+        """누적 프롬프트 토큰 중 Provider 캐시에서 처리된 비율"""
+        prompt_tokens = self._usage["prompt_tokens"]
+        return {
+            **self._usage,
+            "hit_rate": round(self._usage["cached_tokens"] / prompt_tokens, 3) if prompt_tokens else 0.0,
+        }
+
+    def metrics(self) -> dict:
+        """Provider별 풀 사용량 지표"""
+        result = {}
+        for provider, stats in self._stats.items():
+            result[provider] = {
+                "max_connections": stats.max_connections,
+                "open_connections": self._transports[provider].open_connections,
+                "in_flight": stats.in_flight,
+                "peak_in_flight": stats.peak_in_flight,
+                "utilization": round(stats.in_flight / stats.max_connections, 3),
+                "requests_total": stats.requests_total,
+                "saturated_total": stats.saturated_total,
+                "errors_total": stats.errors_total,
+            }
+        return result
+
+
+llm_clients = LLMClientRegistry()
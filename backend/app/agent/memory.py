@@ -0,0 +1,115 @@
+"""
+BAIKAL AI Agent - Chat History Cache
+사용자별 최근 대화 기록 캐시 (턴마다 DB 재조회 대신 증분 추가)
+"""
+
+import json
+from collections import OrderedDict, deque
+from typing import Optional
+
+from app.core.config import settings
+
+
+class InProcessHistoryBackend:
+    """프로세스 메모리 캐시: 사용자별 링 버퍼 + 사용자 수 LRU 제한"""
+
+    def __init__(self, max_users: int, max_messages: int):
+        self.max_users = max_users
+        self.max_messages = max_messages
+        self._buffers: OrderedDict[str, deque] = OrderedDict()
+
+    async def get(self, user_id) -> Optional[list[dict]]:
+        key = str(user_id)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            return None
+        self._buffers.move_to_end(key)
+        return list(buffer)
+
+    async def set(self, user_id, messages: list[dict]):
+        key = str(user_id)
+        self._buffers[key] = deque(messages, maxlen=self.max_messages)
+        self._buffers.move_to_end(key)
+        while len(self._buffers) > self.max_users:
+            self._buffers.popitem(last=False)
+
+    async def append(self, user_id, message: dict):
+        # 캐시에 없는 사용자는 다음 조회 때 DB에서 채운다
+        buffer = self._buffers.get(str(user_id))
+        if buffer is not None:
+            buffer.append(message)
+
+    async def invalidate(self, user_id):
+        self._buffers.pop(str(user_id), None)
+
+    async def aclose(self):
+        self._buffers.clear()
+
+
+class RedisHistoryBackend:
+    """Redis 캐시: 여러 uvicorn 워커가 같은 기록을 공유 (redis 패키지 필요)"""
+
+    def __init__(self, url: str, max_messages: int, ttl: int):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("CHAT_HISTORY_BACKEND=redis requires the 'redis' package") from e
+        self._redis = redis.from_url(url)
+        self.max_messages = max_messages
+        self.ttl = ttl
+
+    @staticmethod
+    def _keys(user_id) -> tuple[str, str]:
+        return f"chat:history:{user_id}", f"chat:history:{user_id}:warm"
+
+    async def get(self, user_id) -> Optional[list[dict]]:
+        key, warm = self._keys(user_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            exists, items = await pipe.exists(warm).lrange(key, 0, -1).execute()
+        if not exists:
+            return None
+        return [json.loads(item) for item in items]
+
+    async def set(self, user_id, messages: list[dict]):
+        key, warm = self._keys(user_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            if messages:
+                pipe.rpush(key, *[json.dumps(m, ensure_ascii=False) for m in messages])
+                pipe.ltrim(key, -self.max_messages, -1)
+                pipe.expire(key, self.ttl)
+            pipe.set(warm, 1, ex=self.ttl)
+            await pipe.execute()
+
+    async def append(self, user_id, message: dict):
+        key, warm = self._keys(user_id)
+        if not await self._redis.exists(warm):
+            return
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, json.dumps(message, ensure_ascii=False))
+            pipe.ltrim(key, -self.max_messages, -1)
+            pipe.expire(key, self.ttl)
+            pipe.expire(warm, self.ttl)
+            await pipe.execute()
+
+    async def invalidate(self, user_id):
+        await self._redis.delete(*self._keys(user_id))
+
+    async def aclose(self):
+        await self._redis.aclose()
+
+
+def _create_backend():
+    if settings.CHAT_HISTORY_BACKEND == "redis":
+        return RedisHistoryBackend(
+            settings.REDIS_URL,
+            max_messages=settings.CHAT_HISTORY_LIMIT,
+            ttl=settings.CHAT_HISTORY_TTL,
+        )
+    return InProcessHistoryBackend(
+        max_users=settings.CHAT_HISTORY_MAX_USERS,
+        max_messages=settings.CHAT_HISTORY_LIMIT,
+    )
+
+
+chat_history = _create_backend()
@@ -0,0 +1,89 @@
+"""
+BAIKAL AI Agent - Prompt Assembly
+Provider 측 프롬프트 캐시(prefix/KV 재사용)가 적중하도록
+변하지 않는 내용 → 사용자별 내용 → 분 단위로 변하는 내용 순으로 메시지를 구성한다.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.db.models import User
+
+# 모든 요청에서 동일한 지시문 (도구 정의와 함께 캐시되는 prefix)
+SYSTEM_PROMPT = """당신은 BAIKAL Groupware AI의 AI 비서입니다.
+당신의 이름은 'BAIKAL AI'입니다.
+
+당신은 사용자의 업무를 도와주는 AI Agent입니다.
+다음 작업을 수행할 수 있습니다:
+
+1. **전자결재** - 결재 문서 생성 (출장, 휴가, 구매 등)
+2. **업무관리** - 업무 생성 및 할당
+3. **일정관리** - 일정 등록
+4. **공지사항** - 공지사항 작성
+5. **사용자 검색** - 사용자 검색
+6. **데이터 조회** - 결재, 업무, 일정, 공지 조회
+
+규칙:
+- 사용자의 요청을 정확히 파악하고 적절한 도구를 사용하세요.
+- 결재 문서를 생성할 때는 적절한 제목과 내용을 작성하세요.
+- 날짜/시간이 필요한 경우, 대화 마지막에 안내되는 현재 시간을 기준으로 합리적인 값을 설정하세요.
+- 친절하고 전문적으로 응답하세요.
+- 한국어로 응답하세요.
+- 작업 완료 후 결과를 명확하게 안내하세요.
+"""
+
+# 사용자별로 고정된 내용
+USER_PROMPT = """현재 사용자 정보:
+- 이름: {user_name}
+- 부서: {user_department}
+- 직급: {user_position}
+"""
+
+# 분 단위로 바뀌는 내용 (마지막 사용자 메시지 직전에 배치)
+TIME_PROMPT = "현재 시간: {current_time}"
+
+
+def build_messages(
+    current_user: User,
+    summary: Optional[str],
+    history: list[dict],
+    message: str,
+) -> list[dict]:
+    """
+    메시지 구성 순서
+    1. 고정 지시문 (모든 사용자 공통)
+    2. 사용자 정보, 이전 대화 요약, 대화 기록 (같은 사용자의 다음 턴까지 유지)
+    3. 현재 시간 (분 단위) + 사용자 메시지
+    """
+    user_prompt = USER_PROMPT.format(
+        user_name=current_user.name,
+        user_department=current_user.department or "미지정",
+        user_position=current_user.position or "미지정",
+    )
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "system", "content": user_prompt},
+    ]
+    if summary:
+        messages.append({"role": "system", "content": f"이전 대화 요약:\n{summary}"})
+    messages.extend({"role": m["role"], "content": m["content"]} for m in history)
+    messages.append({
+        "role": "system",
+        "content": TIME_PROMPT.format(
+            current_time=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC"),
+        ),
+    })
+    messages.append({"role": "user", "content": message})
+    return messages
+
+
+def usage_summary(usage) -> dict:
+    """Provider usage 필드에서 프롬프트/캐시 토큰 수 추출"""
+    if usage is None:
+        return {"prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0}
+    details = getattr(usage, "prompt_tokens_details", None)
+    return {
+        "prompt_tokens": usage.prompt_tokens or 0,
+        "completion_tokens": usage.completion_tokens or 0,
+        "cached_tokens": (getattr(details, "cached_tokens", None) or 0) if details else 0,
+    }
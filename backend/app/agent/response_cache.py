@@ -0,0 +1,142 @@
+"""
+BAIKAL AI Agent - Response Cache
+조회 전용 질문("내 업무 보여줘", "공지사항 알려줘" 등)의 응답을 캐시한다.
+정규화한 질문이 정확히 같을 때만 재사용하고 (날짜·이름 한 글자 차이도 다른 질문),
+이전 대화에 기대는 질문("그거 다시 보여줘", "응")은 저장하지 않는다.
+응답이 의존하는 컬렉션(Task/Notice/Schedule/Approval)이 변경되거나 날짜가 바뀌면 무효화된다.
+"""
+
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from app.core.config import settings
+from app.agent.router import mentioned_tools
+from app.agent.tools import READ_ONLY_TOOLS, TOOL_RESOURCES
+from app.db.changes import collection_versions
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+# 이전 대화를 가리키는 표현 (같은 문장이라도 대화마다 뜻이 달라진다)
+_CONTEXT_PATTERN = re.compile(
+    r"그거|그것|그걸|그건|그게|이거|이것|이걸|저거|저것|거기|그때|그날|그\s*사람|그\s*분"
+    r"|아까|방금|위에|앞에서|이전|다시|그럼|그러면|그리고|나머지|말고|대신|같은\s*걸|또"
+)
+
+# search_users는 라우터 대상이 아니므로 사람 관련 표현으로 판단
+_USER_PATTERN = re.compile(r"사람|직원|사용자|동료|담당자|연락처|부서|팀|이메일")
+
+
+def normalize(text: str) -> str:
+    """비교용 정규화: NFKC, 소문자, 공백/문장부호 제거"""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _NON_WORD.sub("", text)
+
+
+def is_self_contained(message: str, tool_names: list[str]) -> bool:
+    """이전 대화 없이도 뜻이 정해지는 질문인지 (지시어가 없고, 조회한 대상을 모두 직접 언급)"""
+    if _CONTEXT_PATTERN.search(message):
+        return False
+    mentioned = set(mentioned_tools(message))
+    for name in tool_names:
+        if name == "search_users":
+            if not _USER_PATTERN.search(message):
+                return False
+        elif name not in mentioned:
+            return False
+    return True
+
+
+def _utc_today() -> date:
+    # 프롬프트의 현재 시간(UTC) 기준: "오늘 일정"은 날짜가 바뀌면 다른 질문
+    return datetime.now(timezone.utc).date()
+
+
+class _Entry:
+    __slots__ = ("reply", "tool_results", "deps", "day", "expires_at")
+
+    def __init__(self, reply, tool_results, deps, day, expires_at):
+        self.reply = reply
+        self.tool_results = tool_results
+        self.deps = deps
+        self.day = day
+        self.expires_at = expires_at
+
+    def is_valid(self, now: float, today: date) -> bool:
+        if now >= self.expires_at or today != self.day:
+            return False
+        return all(collection_versions.version(c) == v for c, v in self.deps.items())
+
+
+class ResponseCache:
+    """사용자별 응답 캐시 (사용자 수 LRU + 사용자당 항목 수 제한)"""
+
+    def __init__(self, max_users: int, entries_per_user: int, ttl: float):
+        self.max_users = max_users
+        self.entries_per_user = entries_per_user
+        self.ttl = ttl
+        self._users: OrderedDict[str, OrderedDict[str, _Entry]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, user_id, message: str) -> Optional[dict]:
+        """정규화한 질문이 같은 이전 턴의 유효한 응답 반환"""
+        entries = self._users.get(str(user_id))
+        key = normalize(message)
+        entry = entries.get(key) if entries and key else None
+        if entry is not None and not entry.is_valid(time.monotonic(), _utc_today()):
+            del entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._users.move_to_end(str(user_id))
+        entries.move_to_end(key)
+        return {"reply": entry.reply, "tool_results": entry.tool_results}
+
+    def snapshot(self) -> dict[str, int]:
+        """턴 시작 시점의 컬렉션 버전 (도구 실행 중 변경되면 저장된 항목이 무효가 되도록)"""
+        return collection_versions.snapshot(set(TOOL_RESOURCES.values()))
+
+    def store(self, user_id, message: str, reply: str, tool_results: list, tool_names: list[str], versions: dict):
+        """조회 전용 도구만 사용했고 이전 대화에 기대지 않는 턴이면 캐시에 저장"""
+        if not tool_names or any(name not in READ_ONLY_TOOLS for name in tool_names):
+            return
+        # lookup은 같은 문장만 찾으므로 저장 시점에 한 번 거르면 된다
+        if not is_self_contained(message, tool_names):
+            return
+        key = normalize(message)
+        if not key:
+            return
+        deps = {TOOL_RESOURCES[name]: versions[TOOL_RESOURCES[name]] for name in tool_names}
+
+        user_key = str(user_id)
+        entries = self._users.setdefault(user_key, OrderedDict())
+        self._users.move_to_end(user_key)
+        entries[key] = _Entry(reply, tool_results, deps, _utc_today(), time.monotonic() + self.ttl)
+        entries.move_to_end(key)
+        while len(entries) > self.entries_per_user:
+            entries.popitem(last=False)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+
+    def metrics(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "users": len(self._users),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+response_cache = ResponseCache(
+    max_users=settings.RESPONSE_CACHE_MAX_USERS,
+    entries_per_user=settings.RESPONSE_CACHE_ENTRIES_PER_USER,
+    ttl=settings.RESPONSE_CACHE_TTL,
+)
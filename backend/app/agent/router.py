@@ -0,0 +1,86 @@
+"""
+BAIKAL AI Agent - Intent Router
+"공지사항 보여줘", "내 업무 목록" 같은 단순 조회 요청을 LLM 없이 처리한다.
+규칙이 확실히 맞을 때만 도구를 직접 실행하고, 애매하면 None을 반환해 LLM으로 넘긴다.
+"""
+
+import re
+from typing import Optional
+
+# 조회 도구별 대상 키워드
+_DOMAIN_PATTERNS = {
+    "list_notices": re.compile(r"공지"),
+    "list_my_tasks": re.compile(r"업무|할\s*일|태스크|task", re.IGNORECASE),
+    "list_my_schedules": re.compile(r"일정|스케줄|스케쥴|캘린더"),
+    "list_my_approvals": re.compile(r"결재|기안"),
+}
+
+# 조회 의도 표현
+_READ_PATTERN = re.compile(r"보여|알려|조회|목록|리스트|확인|뭐\s*있|뭐야|있어|있나|볼래|보자")
+
+# 생성/변경, 조건(날짜·사람·상태), 질문형 표현이 있으면 LLM이 판단해야 한다
+_AMBIGUOUS_PATTERN = re.compile(
+    r"만들|작성|등록|생성|신청|추가|할당|올려|잡아|삭제|지워|수정|변경|바꿔|상신|승인|반려"
+    r"|요약|정리|분석|비교|검색|찾아|언제|누가|누구|왜|어떻게|몇|얼마"
+    r"|오늘|내일|모레|어제|이번|다음|지난|주간|월간|급한|긴급|완료|진행|대기|중요"
+    r"|\d|님|씨"
+)
+
+# 조회 요청에 흔히 붙는 말 (이 외의 단어가 남으면 대상/조건이 있는 요청으로 보고 LLM에 넘긴다)
+_FILLER_PATTERN = re.compile(
+    r"사항|문서|함|목록|리스트|전체|모든|모두|전부|최근|나의|저의|우리|내|제|좀|한번|다"
+    r"|주세요|주실래요|줄래요?|줘요?|해|봐|요|세요"
+    r"|을|를|이|가|은|는|의|도|랑|하고|\?|!|\.|,"
+)
+
+MAX_ROUTED_LENGTH = 40
+
+_TASK_STATUS = {"todo": "할 일", "in_progress": "진행 중", "done": "완료"}
+_APPROVAL_STATUS = {"draft": "임시저장", "pending": "결재 중", "approved": "승인", "rejected": "반려"}
+
+
+def route(message: str) -> Optional[str]:
+    """확실한 단순 조회 요청이면 실행할 도구 이름, 아니면 None"""
+    text = message.strip()
+    if not text or len(text) > MAX_ROUTED_LENGTH:
+        return None
+    if _AMBIGUOUS_PATTERN.search(text):
+        return None
+    matched = mentioned_tools(text)
+    if len(matched) != 1:
+        return None
+    if not _READ_PATTERN.search(text):
+        return None
+    rest = _DOMAIN_PATTERNS[matched[0]].sub(" ", text)
+    rest = _READ_PATTERN.sub(" ", rest)
+    rest = _FILLER_PATTERN.sub(" ", rest)
+    if rest.strip():
+        return None
+    return matched[0]
+
+
+def mentioned_tools(message: str) -> list[str]:
+    """메시지가 대상(공지/업무/일정/결재)을 직접 언급하는 조회 도구 목록"""
+    return [tool for tool, pattern in _DOMAIN_PATTERNS.items() if pattern.search(message)]
+
+
+def format_reply(tool_name: str, result: dict) -> str:
+    """도구 결과를 템플릿 응답으로 변환"""
+    data = result.get("data", {})
+    lines = [data.get("message", "")]
+
+    if tool_name == "list_notices":
+        lines += [f"- {n['title']} ({n['author']})" for n in data.get("notices", [])]
+    elif tool_name == "list_my_tasks":
+        lines += [
+            f"- [{_TASK_STATUS.get(t['status'], t['status'])}] {t['title']} (우선순위: {t['priority']})"
+            for t in data.get("tasks", [])
+        ]
+    elif tool_name == "list_my_schedules":
+        lines += [f"- {s['title']}: {s['start_time']} ~ {s['end_time']}" for s in data.get("schedules", [])]
+    elif tool_name == "list_my_approvals":
+        lines += [
+            f"- [{_APPROVAL_STATUS.get(a['status'], a['status'])}] {a['title']}"
+            for a in data.get("approvals", [])
+        ]
+    return "\n".join(lines)
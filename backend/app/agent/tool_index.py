@@ -0,0 +1,75 @@
+"""
+BAIKAL AI Agent - Tool Retrieval
+사용자 메시지와 관련된 도구만 골라 턴의 첫 LLM 호출에 보낸다 (도구 스키마 토큰 절감, 프롬프트 캐시가 없는 공급자용).
+도구별 키워드 색인은 모듈 로드 시 한 번 만들고, 도구 조합별 스키마 목록과 토큰 수는 한 번만 계산해 재사용한다.
+"""
+
+import json
+import re
+from functools import lru_cache
+
+from app.core.config import settings
+from app.agent.tools import TOOL_DEFINITIONS, READ_ONLY_TOOLS
+from app.agent.context import count_tokens
+
+# 도구별 대상 키워드
+_TOOL_KEYWORDS = {
+    "create_approval": ["결재", "기안", "신청", "품의", "출장", "휴가", "연차", "반차", "구매", "지출"],
+    "create_task": ["업무", "할 일", "할일", "태스크", "할당", "맡겨", "맡기", "지시", "배정", "담당"],
+    "create_schedule": ["일정", "회의", "미팅", "약속", "스케줄", "캘린더", "예약", "오전", "오후"],
+    "create_notice": ["공지", "게시", "안내문", "전사"],
+    "search_users": ["누구", "찾아", "검색", "사용자", "직원", "연락처", "부서", "팀장", "님"],
+    "list_my_approvals": ["결재", "기안", "신청서", "품의"],
+    "list_my_tasks": ["업무", "할 일", "할일", "태스크"],
+    "list_my_schedules": ["일정", "회의", "미팅", "약속", "스케줄", "캘린더"],
+    "list_notices": ["공지", "게시"],
+}
+
+_CREATE_VERBS = re.compile(r"만들|작성|등록|생성|신청|추가|할당|맡겨|잡아|올려|써|보내|기안")
+_READ_VERBS = re.compile(r"보여|알려|조회|목록|리스트|확인|뭐\s*있|있어|있나")
+
+_TOOL_ORDER = {tool["function"]["name"]: idx for idx, tool in enumerate(TOOL_DEFINITIONS)}
+_TOOLS_BY_NAME = {tool["function"]["name"]: tool for tool in TOOL_DEFINITIONS}
+ALL_TOOL_NAMES = tuple(_TOOL_ORDER)
+
+# 키워드 → 도구 역색인
+_KEYWORD_INDEX: dict[str, list[str]] = {}
+for _name, _keywords in _TOOL_KEYWORDS.items():
+    for _keyword in _keywords:
+        _KEYWORD_INDEX.setdefault(_keyword, []).append(_name)
+
+
+def select_tools(message: str, k: int = None) -> tuple[str, ...]:
+    """
+    메시지와 관련된 상위 k개 도구 이름 (정의 순서로 정렬)
+    관련 키워드가 하나도 없으면 판단할 근거가 없으므로 전체 도구를 반환한다.
+    """
+    k = k or settings.AGENT_TOOL_TOP_K
+    scores: dict[str, float] = {}
+    for keyword, names in _KEYWORD_INDEX.items():
+        if keyword in message:
+            for name in names:
+                scores[name] = scores.get(name, 0) + 2
+    if not scores:
+        return ALL_TOOL_NAMES
+
+    wants_create = bool(_CREATE_VERBS.search(message))
+    wants_read = bool(_READ_VERBS.search(message))
+    for name in scores:
+        if name in READ_ONLY_TOOLS and name != "search_users":
+            scores[name] += 1 if wants_read else 0
+        elif name != "search_users":
+            scores[name] += 1 if wants_create else 0
+
+    ranked = sorted(scores, key=lambda name: (-scores[name], _TOOL_ORDER[name]))[:k]
+    return tuple(sorted(ranked, key=_TOOL_ORDER.__getitem__))
+
+
+@lru_cache(maxsize=None)
+def tool_subset(names: tuple[str, ...]) -> tuple[list[dict], int]:
+    """
+    도구 조합별 (스키마 목록, 스키마 토큰 수) — 조합당 한 번만 계산
+    요청 본문 직렬화는 SDK가 매번 하므로 여기서 직렬화한 문자열은 토큰 수를 세는 데만 쓴다.
+    """
+    tools = [_TOOLS_BY_NAME[name] for name in names]
+    return tools, count_tokens(json.dumps(tools, ensure_ascii=False, separators=(",", ":")))
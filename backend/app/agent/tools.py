@@ -3,6 +3,30 @@ BAIKAL AI Agent Tools - Function Calling 기반 도구 정의
 각 도구는 OpenAI Function Calling 스펙에 맞게 정의됨
 """
 
+# ─── Tool Scheduling Metadata ─────────────────────────
+
+# 도구별 조회/변경 대상 컬렉션
+TOOL_RESOURCES = {
+    "create_approval": "approvals",
+    "create_task": "tasks",
+    "create_schedule": "schedules",
+    "create_notice": "notices",
+    "search_users": "users",
+    "list_my_approvals": "approvals",
+    "list_my_tasks": "tasks",
+    "list_my_schedules": "schedules",
+    "list_notices": "notices",
+}
+
+# DB를 변경하지 않는 도구 (별도 세션에서 동시 실행 가능)
+READ_ONLY_TOOLS = frozenset({
+    "search_users",
+    "list_my_approvals",
+    "list_my_tasks",
+    "list_my_schedules",
+    "list_notices",
+})
+
 # ─── Tool Definitions for OpenAI Function Calling ─────
 
 TOOL_DEFINITIONS = [
@@ -98,6 +122,10 @@ TOOL_DEFINITIONS = [
                     "location": {
                         "type": "string",
                         "description": "장소"
+                    },
+                    "allow_conflict": {
+                        "type": "boolean",
+                        "description": "기존 일정과 시간이 겹쳐도 등록 (사용자가 겹쳐도 된다고 한 경우에만 true)"
                     }
                 },
                 "required": ["title", "start_time", "end_time"]
@@ -175,10 +203,19 @@ TOOL_DEFINITIONS = [
         "type": "function",
         "function": {
             "name": "list_my_schedules",
-            "description": "내 일정 목록을 조회합니다.",
+            "description": "내 일정 목록을 조회합니다. 기간을 주지 않으면 지금 이후의 다가오는 일정을 보여줍니다.",
             "parameters": {
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "from": {
+                        "type": "string",
+                        "description": "조회 시작 시각 (ISO 8601 형식, 예: 2026-03-09T00:00:00)"
+                    },
+                    "to": {
+                        "type": "string",
+                        "description": "조회 끝 시각, 미포함 (ISO 8601 형식, 예: 2026-03-16T00:00:00)"
+                    }
+                },
                 "required": []
             }
         }
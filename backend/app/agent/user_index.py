@@ -0,0 +1,171 @@
+"""
+BAIKAL AI Agent - User Name Index
+에이전트 도구가 이름으로 사용자를 찾을 때 쓰는 메모리 색인.
+정확 일치 → 접두 일치 → 초성 일치 → 부분 일치 순으로 후보를 순위화한다
+(선행 와일드카드 ilike는 인덱스를 쓰지 못해 호출마다 users를 전체 스캔했다).
+users 컬렉션 버전이 바뀌거나 USER_INDEX_TTL이 지나면 다시 적재한다 (다른 워커의 변경 반영).
+"""
+
+import asyncio
+import bisect
+import re
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.changes import collection_versions
+from app.db.models import User
+
+# 후보 순위 (작을수록 우선)
+EXACT, PREFIX, INITIALS, SUBSTRING = range(4)
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_SPACES = re.compile(r"\s+")
+_HONORIFIC = re.compile(r"(님|씨)$")
+
+
+def initials(text: str) -> str:
+    """한글 음절은 초성으로, 나머지 문자는 그대로 ("김철수" → "ㄱㅊㅅ")"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_FIRST <= code <= _HANGUL_LAST:
+            out.append(_CHOSEONG[(code - _HANGUL_FIRST) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def normalize_name(text: str) -> str:
+    """비교용 이름: 공백 제거, 소문자, 호칭(님/씨) 제거"""
+    text = _SPACES.sub("", text or "").lower()
+    return _HONORIFIC.sub("", text) or text
+
+
+@dataclass(frozen=True, slots=True)
+class UserEntry:
+    id: UUID
+    name: str
+    department: str
+    position: str
+    is_active: bool
+    key: str
+    initials: str
+
+    def brief(self) -> dict:
+        return {"id": str(self.id), "name": self.name, "department": self.department, "position": self.position}
+
+
+@dataclass(frozen=True, slots=True)
+class Match:
+    user: UserEntry
+    rank: int
+
+
+class UserIndex:
+    """이름 → 사용자 후보 색인 (프로세스 단위)"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: list[UserEntry] = []
+        self._by_key: dict[str, list[int]] = {}        # 정규화 이름 → entry idx
+        self._keys: list[tuple[str, int]] = []        # (정규화 이름, entry idx) 정렬
+        self._initials: list[tuple[str, int]] = []    # (초성, entry idx) 정렬
+        self._version = -1
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_stale(self) -> bool:
+        return (
+            self._version != collection_versions.version("users")
+            or time.monotonic() - self._loaded_at > self.ttl
+        )
+
+    async def ensure_fresh(self, db: AsyncSession):
+        if not self._is_stale():
+            return
+        async with self._lock:
+            if self._is_stale():
+                await self._load(db)
+
+    async def _load(self, db: AsyncSession):
+        version = collection_versions.version("users")
+        result = await db.execute(
+            select(User.id, User.name, User.department, User.position, User.is_active)
+        )
+        entries = []
+        for user_id, name, department, position, is_active in result.all():
+            key = normalize_name(name)
+            entries.append(UserEntry(
+                id=user_id, name=name, department=department or "", position=position or "",
+                is_active=bool(is_active), key=key, initials=initials(key),
+            ))
+
+        by_key: dict[str, list[int]] = {}
+        for idx, entry in enumerate(entries):
+            by_key.setdefault(entry.key, []).append(idx)
+        self._entries = entries
+        self._by_key = by_key
+        self._keys = sorted((e.key, i) for i, e in enumerate(entries))
+        self._initials = sorted((e.initials, i) for i, e in enumerate(entries))
+        self._version = version
+        self._loaded_at = time.monotonic()
+
+    @staticmethod
+    def _prefixed(pairs: list[tuple[str, int]], prefix: str) -> Iterable[int]:
+        start = bisect.bisect_left(pairs, (prefix, -1))
+        for key, idx in pairs[start:]:
+            if not key.startswith(prefix):
+                break
+            yield idx
+
+    def search(self, query: str, limit: int = 10, active_only: bool = True) -> list[Match]:
+        """순위별 후보 (같은 순위 안에서는 이름순)"""
+        q = normalize_name(query)  # 빈 검색어는 모든 사용자와 접두 일치
+        ranks: dict[int, int] = {}
+
+        def add(idx: int, rank: int):
+            if rank < ranks.get(idx, SUBSTRING + 1):
+                ranks[idx] = rank
+
+        for idx in self._by_key.get(q, []):
+            add(idx, EXACT)
+        for idx in self._prefixed(self._keys, q):
+            add(idx, PREFIX)
+        if all(ch in _CHOSEONG_SET for ch in q):
+            for idx in self._prefixed(self._initials, q):
+                add(idx, INITIALS)
+        if len(ranks) < limit:
+            for idx, entry in enumerate(self._entries):
+                if q in entry.key:
+                    add(idx, SUBSTRING)
+
+        matches = [
+            Match(self._entries[idx], rank) for idx, rank in ranks.items()
+            if not active_only or self._entries[idx].is_active
+        ]
+        matches.sort(key=lambda m: (m.rank, m.user.name))
+        return matches[:limit]
+
+    async def resolve_many(self, db: AsyncSession, names: list[str]) -> dict[str, list[Match]]:
+        """여러 이름을 한 번에 해석 (색인이 최신이면 DB 조회 없음)"""
+        await self.ensure_fresh(db)
+        return {name: self.search(name) for name in dict.fromkeys(names)}
+
+
+def best_match(matches: list[Match]) -> Optional[UserEntry]:
+    """최상위 순위 후보가 한 명이면 그 사용자, 없거나 여러 명이면 None"""
+    if not matches:
+        return None
+    top = [m for m in matches if m.rank == matches[0].rank]
+    return top[0].user if len(top) == 1 else None
+
+
+user_index = UserIndex(ttl=settings.USER_INDEX_TTL)
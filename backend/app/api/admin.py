@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends
+
+from app.core.config import settings
+from app.core.events import event_bus
+from app.db.database import engine
+from app.db.models import User
+from app.db.pool import pool_stats, InstrumentedQueuePool
+from app.db.user_directory import user_directory
+from app.api.deps import require_admin
+from app.api.user_cache import user_cache
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/db-pool")
+async def db_pool_metrics(current_user: User = Depends(require_admin)):
+    """커넥션 풀 현황 (체크아웃/오버플로/대기 시간/타임아웃)"""
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return {"dialect": engine.dialect.name, "pool": type(pool).__name__}
+    return {
+        "dialect": engine.dialect.name,
+        "pool": type(pool).__name__,
+        "recycle": settings.DB_POOL_RECYCLE,
+        "pre_ping": settings.DB_POOL_PRE_PING,
+        **pool_stats.snapshot(pool),
+        "user_cache": user_cache.metrics(),
+        "user_directory": user_directory.metrics(),
+        "event_bus": event_bus.metrics(),
+    }
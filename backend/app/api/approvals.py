@@ -1,27 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
+from typing import Optional
 from uuid import UUID
 from datetime import datetime, timezone
 
+from app.core.config import settings
+from app.core.events import notify_approval
 from app.db.database import get_db
 from app.db.models import Approval, ApprovalLine, ApprovalLog, User
+from app.db.user_directory import user_directory
 from app.schemas.schemas import (
     ApprovalCreate, ApprovalResponse, ApprovalActionRequest,
+    ApprovalBulkActionRequest, ApprovalBulkActionResponse, ApprovalBulkActionResult,
     ApprovalLineResponse, UserBrief,
 )
 from app.api.deps import get_current_user
+from app.api.pagination import PageParams, page_params, paginate, finish_page
+from app.api.lean import json_response
+from app.api.http_cache import conditional
 
 router = APIRouter(prefix="/approvals", tags=["Approvals"])
 
 
-def _build_approval_response(approval: Approval) -> dict:
+def _build_approval_response(approval: Approval, users: dict[UUID, dict]) -> ApprovalResponse:
     lines = []
     for line in approval.approval_lines:
         lines.append(ApprovalLineResponse(
             id=line.id,
-            approver=UserBrief.model_validate(line.approver),
+            approver=UserBrief.model_validate(users[line.approver_id]),
             order=line.order,
             action=line.action,
             comment=line.comment or "",
@@ -33,119 +41,283 @@ def _build_approval_response(approval: Approval) -> dict:
         content=approval.content,
         category=approval.category,
         status=approval.status,
-        author=UserBrief.model_validate(approval.author),
+        author=UserBrief.model_validate(users[approval.author_id]),
+        current_step=approval.current_step,
+        current_approver_id=approval.current_approver_id,
         created_at=approval.created_at,
         updated_at=approval.updated_at,
         approval_lines=lines,
     )
 
 
+async def _approval_response(db: AsyncSession, approval: Approval) -> ApprovalResponse:
+    """결재라인이 로드된 문서 → 응답 (작성자/결재자는 user_directory에서)"""
+    users = await user_directory.briefs(
+        db, [approval.author_id, *(line.approver_id for line in approval.approval_lines)]
+    )
+    return _build_approval_response(approval, users)
+
+
+def _advance_turn(approval: Approval):
+    """다음 결재 차례(대기 중인 가장 앞 순서 결재라인)를 문서에 반영, 없으면 비움"""
+    for line in sorted(approval.approval_lines, key=lambda l: l.order):
+        if line.action == "pending":
+            approval.current_step = line.order
+            approval.current_approver_id = line.approver_id
+            return
+    approval.current_step = None
+    approval.current_approver_id = None
+
+
+def _apply_action(approval: Approval, user_id: UUID, action: str, comment: Optional[str]) -> ApprovalLog:
+    """
+    결재 문서 한 건에 승인/반려 적용 (approval_lines가 로드된 상태여야 한다)
+    검증에 실패하면 HTTPException, 성공하면 세션에 추가할 ApprovalLog 반환
+    """
+    if approval.status != "pending":
+        raise HTTPException(status_code=400, detail="Approval is not pending")
+
+    if approval.current_approver_id != user_id:
+        if any(l.approver_id == user_id and l.action == "pending" for l in approval.approval_lines):
+            raise HTTPException(status_code=400, detail="Not your turn to approve")
+        raise HTTPException(status_code=403, detail="You are not a pending approver")
+    my_line = next(l for l in approval.approval_lines if l.order == approval.current_step)
+
+    if action == "approved":
+        my_line.action = "approved"
+        my_line.comment = comment or ""
+        my_line.acted_at = datetime.now(timezone.utc)
+        _advance_turn(approval)
+        if approval.current_step is None:
+            approval.status = "approved"
+
+    elif action == "rejected":
+        my_line.action = "rejected"
+        my_line.comment = comment or ""
+        my_line.acted_at = datetime.now(timezone.utc)
+        approval.status = "rejected"
+        approval.current_step = None
+        approval.current_approver_id = None
+    else:
+        raise HTTPException(status_code=400, detail="Invalid action")
+
+    return ApprovalLog(
+        approval_id=approval.id,
+        user_id=user_id,
+        action=action,
+        comment=comment or "",
+    )
+
+
+def _approval_cursor(approval) -> list:
+    return [approval.created_at, approval.id]
+
+
+def _approval_rows():
+    """목록용 컬럼 조회 (결재라인은 _approval_line_rows로 따로)"""
+    return select(
+        Approval.id, Approval.title, Approval.content, Approval.category, Approval.status,
+        Approval.author_id, Approval.current_step, Approval.current_approver_id,
+        Approval.created_at, Approval.updated_at,
+    )
+
+
+def _approval_line_rows(approval_ids):
+    """여러 결재 문서의 결재라인을 한 번에 조회"""
+    return (
+        select(
+            ApprovalLine.approval_id, ApprovalLine.id, ApprovalLine.approver_id, ApprovalLine.order,
+            ApprovalLine.action, ApprovalLine.comment, ApprovalLine.acted_at,
+        )
+        .where(ApprovalLine.approval_id.in_(approval_ids))
+        .order_by(ApprovalLine.approval_id, ApprovalLine.order)
+    )
+
+
+def _approval_dicts(rows, line_rows, users: dict[UUID, dict]) -> list[dict]:
+    lines: dict[UUID, list[dict]] = {row.id: [] for row in rows}
+    for line in line_rows:
+        lines[line.approval_id].append({
+            "id": line.id,
+            "approver": users.get(line.approver_id),
+            "order": line.order,
+            "action": line.action,
+            "comment": line.comment or "",
+            "acted_at": line.acted_at,
+        })
+    return [
+        {
+            "id": row.id,
+            "title": row.title,
+            "content": row.content,
+            "category": row.category,
+            "status": row.status,
+            "author": users.get(row.author_id),
+            "current_step": row.current_step,
+            "current_approver_id": row.current_approver_id,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "approval_lines": lines[row.id],
+        }
+        for row in rows
+    ]
+
+
+async def _approval_list(db: AsyncSession, rows) -> list[dict]:
+    """결재 문서 행 + 해당 페이지 문서들의 결재라인 → 응답 dict 목록"""
+    line_rows = []
+    if rows:
+        line_rows = (await db.execute(_approval_line_rows([row.id for row in rows]))).all()
+    users = await user_directory.briefs(
+        db, [*(row.author_id for row in rows), *(line.approver_id for line in line_rows)]
+    )
+    return _approval_dicts(rows, line_rows, users)
+
+
 @router.post("", response_model=ApprovalResponse, status_code=201)
 async def create_approval(
     req: ApprovalCreate,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    users = await user_directory.briefs(db, [current_user.id, *req.approver_ids])
+    unknown = [str(i) for i in req.approver_ids if i not in users]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Approver not found: {', '.join(unknown)}")
+
+    # 응답은 세션에 있는 객체로 조립한다 (flush 후 다시 조회하지 않음)
     approval = Approval(
         title=req.title,
         content=req.content,
         category=req.category or "general",
         status="draft",
         author_id=current_user.id,
+        approval_lines=[
+            ApprovalLine(approver_id=approver_id, order=idx + 1, action="pending")
+            for idx, approver_id in enumerate(req.approver_ids)
+        ],
     )
     db.add(approval)
+    db.add(ApprovalLog(approval=approval, user_id=current_user.id, action="created"))
     await db.flush()
-
-    for idx, approver_id in enumerate(req.approver_ids):
-        line = ApprovalLine(
-            approval_id=approval.id,
-            approver_id=approver_id,
-            order=idx + 1,
-            action="pending",
-        )
-        db.add(line)
-
-    log = ApprovalLog(
-        approval_id=approval.id,
-        user_id=current_user.id,
-        action="created",
-    )
-    db.add(log)
-    await db.flush()
-
-    result = await db.execute(
-        select(Approval)
-        .options(
-            selectinload(Approval.author),
-            selectinload(Approval.approval_lines).selectinload(ApprovalLine.approver),
-        )
-        .where(Approval.id == approval.id)
-    )
-    approval = result.scalar_one()
-    return _build_approval_response(approval)
+    notify_approval(db, "approval.created", approval)
+    return _build_approval_response(approval, users)
 
 
-@router.get("", response_model=list[ApprovalResponse])
+@router.get("", response_model=list[ApprovalResponse], dependencies=[conditional("approvals", "users")])
 async def list_approvals(
+    request: Request,
+    response: Response,
     status: str = None,
+    category: str = None,
+    author_id: UUID = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    query = (
-        select(Approval)
-        .options(
-            selectinload(Approval.author),
-            selectinload(Approval.approval_lines).selectinload(ApprovalLine.approver),
-        )
-        .order_by(Approval.created_at.desc())
-    )
+    query = _approval_rows()
     if status:
         query = query.where(Approval.status == status)
-    result = await db.execute(query)
-    approvals = result.scalars().all()
-    return [_build_approval_response(a) for a in approvals]
+    if category:
+        query = query.where(Approval.category == category)
+    if author_id:
+        query = query.where(Approval.author_id == author_id)
+    result = await db.execute(paginate(query, [Approval.created_at, Approval.id], page))
+    rows = finish_page(result.all(), page, _approval_cursor, request, response)
+    return json_response(await _approval_list(db, rows), response)
 
 
-@router.get("/my", response_model=list[ApprovalResponse])
+@router.get("/my", response_model=list[ApprovalResponse], dependencies=[conditional("approvals", "users")])
 async def my_approvals(
+    request: Request,
+    response: Response,
+    status: str = None,
+    category: str = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Approval)
-        .options(
-            selectinload(Approval.author),
-            selectinload(Approval.approval_lines).selectinload(ApprovalLine.approver),
-        )
-        .where(Approval.author_id == current_user.id)
-        .order_by(Approval.created_at.desc())
-    )
-    return [_build_approval_response(a) for a in result.scalars().all()]
+    query = _approval_rows().where(Approval.author_id == current_user.id)
+    if status:
+        query = query.where(Approval.status == status)
+    if category:
+        query = query.where(Approval.category == category)
+    result = await db.execute(paginate(query, [Approval.created_at, Approval.id], page))
+    rows = finish_page(result.all(), page, _approval_cursor, request, response)
+    return json_response(await _approval_list(db, rows), response)
 
 
-@router.get("/pending", response_model=list[ApprovalResponse])
+@router.get("/pending", response_model=list[ApprovalResponse], dependencies=[conditional("approvals", "users")])
 async def pending_approvals(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    # 내 차례인 문서만 (current_approver_id 인덱스 한 번으로 조회)
+    query = _approval_rows().where(Approval.current_approver_id == current_user.id)
+    result = await db.execute(paginate(query, [Approval.created_at, Approval.id], page))
+    rows = finish_page(result.all(), page, _approval_cursor, request, response)
+    return json_response(await _approval_list(db, rows), response)
+
+
+@router.post("/actions", response_model=ApprovalBulkActionResponse)
+async def bulk_action_approvals(
+    req: ApprovalBulkActionRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    여러 결재 문서 일괄 승인/반려
+    문서와 결재라인을 한 번에 조회하고, 처리 가능한 건만 한 번의 flush로 반영한다.
+    건별 실패(차례 아님, 권한 없음 등)는 결과 항목으로 돌려주고 나머지는 그대로 처리한다.
+    """
+    if len(req.items) > settings.APPROVAL_BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400, detail=f"Too many items (max {settings.APPROVAL_BULK_MAX_ITEMS})"
+        )
+
     result = await db.execute(
         select(Approval)
-        .join(ApprovalLine)
-        .options(
-            selectinload(Approval.author),
-            selectinload(Approval.approval_lines).selectinload(ApprovalLine.approver),
-        )
-        .where(
-            ApprovalLine.approver_id == current_user.id,
-            ApprovalLine.action == "pending",
-            Approval.status == "pending",
-        )
-        .order_by(Approval.created_at.desc())
+        .options(joinedload(Approval.approval_lines))
+        .where(Approval.id.in_({item.approval_id for item in req.items}))
+    )
+    approvals = {a.id: a for a in result.unique().scalars().all()}
+
+    results = []
+    seen = set()
+    for item in req.items:
+        approval = approvals.get(item.approval_id)
+        try:
+            if approval is None:
+                raise HTTPException(status_code=404, detail="Approval not found")
+            if item.approval_id in seen:
+                raise HTTPException(status_code=400, detail="Duplicate approval in request")
+            seen.add(item.approval_id)
+            db.add(_apply_action(approval, current_user.id, item.action, item.comment))
+            notify_approval(db, "approval.actioned", approval)
+        except HTTPException as e:
+            results.append(ApprovalBulkActionResult(
+                approval_id=item.approval_id, success=False, status_code=e.status_code, error=e.detail,
+            ))
+            continue
+        results.append(ApprovalBulkActionResult(
+            approval_id=approval.id,
+            success=True,
+            status_code=200,
+            status=approval.status,
+            current_step=approval.current_step,
+        ))
+
+    await db.flush()
+    succeeded = sum(1 for r in results if r.success)
+    return ApprovalBulkActionResponse(
+        results=results, succeeded=succeeded, failed=len(results) - succeeded,
     )
-    return [_build_approval_response(a) for a in result.scalars().all()]
 
 
-@router.get("/{approval_id}", response_model=ApprovalResponse)
+@router.get("/{approval_id}", response_model=ApprovalResponse, dependencies=[conditional("approvals", "users")])
 async def get_approval(
     approval_id: UUID,
     db: AsyncSession = Depends(get_db),
@@ -153,16 +325,13 @@ async def get_approval(
 ):
     result = await db.execute(
         select(Approval)
-        .options(
-            selectinload(Approval.author),
-            selectinload(Approval.approval_lines).selectinload(ApprovalLine.approver),
-        )
+        .options(selectinload(Approval.approval_lines))
         .where(Approval.id == approval_id)
     )
     approval = result.scalar_one_or_none()
     if not approval:
         raise HTTPException(status_code=404, detail="Approval not found")
-    return _build_approval_response(approval)
+    return await _approval_response(db, approval)
 
 
 @router.post("/{approval_id}/submit", response_model=ApprovalResponse)
@@ -173,10 +342,7 @@ async def submit_approval(
 ):
     result = await db.execute(
         select(Approval)
-        .options(
-            selectinload(Approval.author),
-            selectinload(Approval.approval_lines).selectinload(ApprovalLine.approver),
-        )
+        .options(selectinload(Approval.approval_lines))
         .where(Approval.id == approval_id)
     )
     approval = result.scalar_one_or_none()
@@ -190,11 +356,12 @@ async def submit_approval(
         raise HTTPException(status_code=400, detail="No approval line set")
 
     approval.status = "pending"
+    _advance_turn(approval)
     log = ApprovalLog(approval_id=approval.id, user_id=current_user.id, action="submitted")
     db.add(log)
     await db.flush()
-    await db.refresh(approval)
-    return _build_approval_response(approval)
+    notify_approval(db, "approval.submitted", approval)
+    return await _approval_response(db, approval)
 
 
 @router.post("/{approval_id}/action", response_model=ApprovalResponse)
@@ -206,61 +373,14 @@ async def action_approval(
 ):
     result = await db.execute(
         select(Approval)
-        .options(
-            selectinload(Approval.author),
-            selectinload(Approval.approval_lines).selectinload(ApprovalLine.approver),
-        )
+        .options(selectinload(Approval.approval_lines))
         .where(Approval.id == approval_id)
     )
     approval = result.scalar_one_or_none()
     if not approval:
         raise HTTPException(status_code=404, detail="Approval not found")
-    if approval.status != "pending":
-        raise HTTPException(status_code=400, detail="Approval is not pending")
-
-    my_line = None
-    for line in approval.approval_lines:
-        if str(line.approver_id) == str(current_user.id) and line.action == "pending":
-            my_line = line
-            break
-
-    if not my_line:
-        raise HTTPException(status_code=403, detail="You are not a pending approver")
-
-    for line in sorted(approval.approval_lines, key=lambda l: l.order):
-        if line.action == "pending":
-            if str(line.approver_id) != str(current_user.id):
-                raise HTTPException(status_code=400, detail="Not your turn to approve")
-            break
-
-    if req.action == "approved":
-        my_line.action = "approved"
-        my_line.comment = req.comment or ""
-        my_line.acted_at = datetime.now(timezone.utc)
-
-        all_approved = all(
-            l.action == "approved"
-            for l in approval.approval_lines
-            if str(l.id) != str(my_line.id)
-        )
-        if all_approved:
-            approval.status = "approved"
-
-    elif req.action == "rejected":
-        my_line.action = "rejected"
-        my_line.comment = req.comment or ""
-        my_line.acted_at = datetime.now(timezone.utc)
-        approval.status = "rejected"
-    else:
-        raise HTTPException(status_code=400, detail="Invalid action")
-
-    log = ApprovalLog(
-        approval_id=approval.id,
-        user_id=current_user.id,
-        action=req.action,
-        comment=req.comment or "",
-    )
+    log = _apply_action(approval, current_user.id, req.action, req.comment)
     db.add(log)
     await db.flush()
-    await db.refresh(approval)
-    return _build_approval_response(approval)
+    notify_approval(db, "approval.actioned", approval)
+    return await _approval_response(db, approval)
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.db.database import get_db
 from app.db.models import User
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.security import verify_password_async, get_password_hash_async, create_access_token
 from app.schemas.schemas import LoginRequest, TokenResponse, UserCreate, UserResponse
 from app.api.deps import get_current_user, require_admin
+from app.api.pagination import PageParams, page_params, paginate, finish_page
+from app.api.lean import json_response
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -15,11 +17,17 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 async def login(req: LoginRequest, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == req.email))
     user = result.scalar_one_or_none()
-    if not user or not verify_password(req.password, user.hashed_password):
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await verify_password_async(req.password, user.hashed_password)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
+    if new_hash:
+        # 비용 설정이 바뀐 해시를 로그인 시점에 갱신 (평문을 알 수 있는 유일한 때)
+        user.hashed_password = new_hash
     token = create_access_token(data={"sub": str(user.id), "role": user.role})
     return TokenResponse(
         access_token=token,
@@ -36,7 +44,7 @@ async def register(req: UserCreate, db: AsyncSession = Depends(get_db)):
     
     user = User(
         email=req.email,
-        hashed_password=get_password_hash(req.password),
+        hashed_password=await get_password_hash_async(req.password),
         name=req.name,
         department=req.department or "",
         position=req.position or "",
@@ -55,9 +63,19 @@ async def get_me(current_user: User = Depends(get_current_user)):
 
 @router.get("/users", response_model=list[UserResponse])
 async def list_users(
+    request: Request,
+    response: Response,
+    department: str = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(User).where(User.is_active == True).order_by(User.name))
-    users = result.scalars().all()
-    return [UserResponse.model_validate(u) for u in users]
+    query = select(
+        User.id, User.email, User.name, User.department, User.position,
+        User.role, User.is_active, User.created_at,
+    ).where(User.is_active == True)
+    if department:
+        query = query.where(User.department == department)
+    result = await db.execute(paginate(query, [User.name, User.id], page, default_order="asc"))
+    rows = finish_page(result.all(), page, lambda u: [u.name, u.id], request, response)
+    return json_response([row._asdict() for row in rows], response)
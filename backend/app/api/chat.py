@@ -1,11 +1,14 @@
+import json
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
 from app.db.models import User
 from app.schemas.schemas import ChatRequest, ChatResponse
 from app.api.deps import get_current_user
-from app.agent.engine import run_agent
+from app.agent.engine import run_agent, stream_agent
 
 router = APIRouter(prefix="/chat", tags=["AI Chat"])
 
@@ -25,4 +28,34 @@ async def chat(
     return ChatResponse(
         reply=result["reply"],
         tool_results=result.get("tool_results"),
+        steps=result.get("steps"),
+        usage=result.get("usage"),
     )
+
+
+@router.post("/stream")
+async def chat_stream(
+    req: ChatRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """AI Agent와 대화 (Server-Sent Events 스트리밍)
+
+    이벤트: token, tool_call_start, tool_call_end, step, done, error
+    """
+    async def event_source():
+        try:
+            async for event in stream_agent(req.message, current_user):
+                yield _sse(event)
+        except Exception as e:
+            yield _sse({"type": "error", "detail": str(e)})
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: dict) -> str:
+    data = json.dumps(event, ensure_ascii=False, default=str)
+    return f"event: {event['type']}\ndata: {data}\n\n"
@@ -6,7 +6,9 @@ from uuid import UUID
 
 from app.db.database import get_db
 from app.db.models import User
+from app.core.config import settings
 from app.core.security import decode_access_token
+from app.api.user_cache import user_cache
 
 security = HTTPBearer()
 
@@ -15,7 +17,11 @@ async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
-    token = credentials.credentials
+    return await authenticate_token(db, credentials.credentials)
+
+
+async def authenticate_token(db: AsyncSession, token: str) -> User:
+    """액세스 토큰 → 사용자 (헤더를 쓸 수 없는 SSE 스트림도 사용)"""
     payload = decode_access_token(token)
     if payload is None:
         raise HTTPException(
@@ -28,13 +34,20 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
         )
-    result = await db.execute(select(User).where(User.id == UUID(user_id)))
+    user_id = UUID(user_id)
+    if settings.USER_CACHE_ENABLED:
+        user = user_cache.get(db, user_id)
+        if user is not None:
+            return user
+    result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
+    if settings.USER_CACHE_ENABLED:
+        user_cache.put(user)
     return user
 
 
@@ -45,3 +58,4 @@ async def require_admin(current_user: User = Depends(get_current_user)) -> User:
             detail="Admin access required",
         )
     return current_user
+
@@ -0,0 +1,73 @@
+import asyncio
+import json
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+
+from app.core.config import settings
+from app.core.events import event_bus
+from app.core.security import decode_access_token
+from app.db.database import async_session
+from app.api.deps import authenticate_token
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+optional_security = HTTPBearer(auto_error=False)
+
+
+@router.get("")
+async def event_stream(
+    access_token: Optional[str] = Query(None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+):
+    """
+    내 결재/업무 변경 알림 (Server-Sent Events 스트리밍)
+    EventSource는 헤더를 붙일 수 없으므로 ?access_token= 으로도 인증한다.
+    스트림 동안 DB 연결을 잡지 않고, 토큰이 만료되면 스트림을 닫는다 (클라이언트가 새 토큰으로 다시 연결).
+
+    이벤트: ready, approval.created, approval.submitted, approval.actioned,
+           task.created, task.updated, schedule.created, notice.created, resync
+    """
+    token = credentials.credentials if credentials else access_token
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    async with async_session() as db:
+        user = await authenticate_token(db, token)
+    user_id = user.id
+    expires_at = decode_access_token(token).get("exp")
+
+    async def event_source():
+        queue = event_bus.subscribe(user_id)
+        try:
+            yield _sse({"type": "ready", "data": {"heartbeat": settings.EVENT_HEARTBEAT}})
+            while True:
+                timeout = settings.EVENT_HEARTBEAT
+                if expires_at is not None:
+                    remaining = expires_at - time.time()
+                    if remaining <= 0:
+                        break
+                    timeout = min(timeout, remaining)
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                if message is None:
+                    break
+                yield _sse(message)
+        finally:
+            event_bus.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(message: dict) -> str:
+    data = json.dumps(message["data"], ensure_ascii=False, default=str)
+    return f"event: {message['type']}\ndata: {data}\n\n"
@@ -0,0 +1,77 @@
+"""
+BAIKAL Groupware AI - Conditional GET
+조회 API에 ETag/Last-Modified를 붙이고, 클라이언트가 가진 버전이 최신이면 DB 조회 없이 304를 돌려준다.
+검증값은 응답이 의존하는 컬렉션 버전(app/db/changes.py — API와 ToolExecutor의 커밋이 모두 올린다),
+요청 URL, 사용자로 만든다.
+컬렉션 버전은 프로세스 단위이므로 HTTP_CACHE_WINDOW마다 검증값을 갱신해 다른 워커의 변경이 그 안에 반영되게 한다.
+"""
+
+import hashlib
+import time
+import uuid
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi import Depends, HTTPException, Request, Response
+
+from app.core.config import settings
+from app.db.changes import collection_versions
+from app.db.models import User
+from app.api.deps import get_current_user
+
+# 재시작하면 버전이 0부터 다시 시작하므로 프로세스마다 다른 값을 섞는다
+_INSTANCE = uuid.uuid4().hex
+_STARTED_AT = time.time()
+
+
+def _validators(request: Request, user: User, collections: tuple[str, ...]) -> tuple[str, float]:
+    window = settings.HTTP_CACHE_WINDOW
+    window_index = int(time.time() // window) if window > 0 else 0
+    versions = ",".join(f"{c}:{collection_versions.version(c)}" for c in collections)
+    key = f"{_INSTANCE}|{window_index}|{user.id}|{request.url.path}?{request.url.query}|{versions}"
+    etag = f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+    last_modified = max(
+        _STARTED_AT,
+        window_index * window,
+        *(collection_versions.last_modified(c) for c in collections),
+    )
+    return etag, last_modified
+
+
+def _not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # GET에는 약한 비교 (W/ 접두사 무시)
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def conditional(*collections: str):
+    """
+    라우트 dependencies에 넣는 조건부 GET 의존성
+    변경이 없으면 304(본문 없음)로 끝내고, 아니면 응답에 ETag/Last-Modified를 설정한다.
+    """
+    async def dependency(
+        request: Request,
+        response: Response,
+        current_user: User = Depends(get_current_user),
+    ):
+        if not settings.HTTP_CACHE_ENABLED:
+            return
+        etag, last_modified = _validators(request, current_user, collections)
+        headers = {
+            "ETag": etag,
+            "Last-Modified": formatdate(last_modified, usegmt=True),
+            "Cache-Control": "private, no-cache",
+        }
+        if _not_modified(request, etag, last_modified):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return Depends(dependency)
@@ -0,0 +1,21 @@
+"""
+BAIKAL Groupware AI - Lean List Responses
+목록 API 읽기 경로: ORM 엔티티 대신 필요한 컬럼만 행(튜플)으로 조회해 dict로 만들고 JSON 바이트로 바로 직렬화한다.
+작성자/담당자 등 UserBrief는 users를 조인하지 않고 app/db/user_directory.py에서 채운다.
+엔티티 하이드레이션 → 응답 모델 생성 → response_model 재검증을 모두 건너뛴다.
+응답 형식은 각 엔드포인트의 response_model과 같다 (문서/스키마는 response_model 그대로).
+"""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic_core import to_json
+
+
+def json_response(content: Any, response: Response) -> Response:
+    """dict/list를 JSON 바이트로 직렬화 (의존성으로 받은 response의 헤더 — 페이지 커서 등 — 를 옮겨 담는다)"""
+    return Response(
+        content=to_json(content),
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
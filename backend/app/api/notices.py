@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 from uuid import UUID
 
+from app.core.events import notify_notice
 from app.db.database import get_db
 from app.db.models import Notice, User
+from app.db.user_directory import user_directory
 from app.schemas.schemas import NoticeCreate, NoticeResponse, UserBrief
 from app.api.deps import get_current_user
+from app.api.pagination import PageParams, page_params, paginate, finish_page
+from app.api.lean import json_response
+from app.api.http_cache import conditional
 
 router = APIRouter(prefix="/notices", tags=["Notices"])
 
@@ -18,6 +22,7 @@ async def create_notice(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    users = await user_directory.briefs(db, [current_user.id])
     notice = Notice(
         title=req.title,
         content=req.content,
@@ -26,49 +31,74 @@ async def create_notice(
     )
     db.add(notice)
     await db.flush()
-
-    result = await db.execute(
-        select(Notice).options(selectinload(Notice.author)).where(Notice.id == notice.id)
-    )
-    notice = result.scalar_one()
-    return _build_notice_response(notice)
+    notify_notice(db, "notice.created", notice)
+    return _build_notice_response(notice, users)
 
 
-@router.get("", response_model=list[NoticeResponse])
+@router.get("", response_model=list[NoticeResponse], dependencies=[conditional("notices", "users")])
 async def list_notices(
+    request: Request,
+    response: Response,
+    pinned: bool = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Notice)
-        .options(selectinload(Notice.author))
-        .order_by(Notice.is_pinned.desc(), Notice.created_at.desc())
-    )
-    return [_build_notice_response(n) for n in result.scalars().all()]
+    query = _notice_rows()
+    if pinned is not None:
+        query = query.where(Notice.is_pinned == pinned)
+    # 고정 공지 우선, 최신순
+    keys = [Notice.is_pinned, Notice.created_at, Notice.id]
+    result = await db.execute(paginate(query, keys, page))
+    rows = finish_page(result.all(), page, _notice_cursor, request, response)
+    users = await user_directory.briefs(db, [r.author_id for r in rows])
+    return json_response([_notice_row(r, users) for r in rows], response)
 
 
-@router.get("/{notice_id}", response_model=NoticeResponse)
+@router.get("/{notice_id}", response_model=NoticeResponse, dependencies=[conditional("notices", "users")])
 async def get_notice(
     notice_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Notice).options(selectinload(Notice.author)).where(Notice.id == notice_id)
-    )
-    notice = result.scalar_one_or_none()
+    notice = await db.get(Notice, notice_id)
     if not notice:
         raise HTTPException(status_code=404, detail="Notice not found")
-    return _build_notice_response(notice)
+    users = await user_directory.briefs(db, [notice.author_id])
+    return _build_notice_response(notice, users)
+
+
+def _notice_cursor(notice) -> list:
+    return [notice.is_pinned, notice.created_at, notice.id]
+
+
+def _notice_rows():
+    """목록용 컬럼 조회"""
+    return select(
+        Notice.id, Notice.title, Notice.content, Notice.is_pinned,
+        Notice.author_id, Notice.created_at, Notice.updated_at,
+    )
+
+
+def _notice_row(row, users: dict[UUID, dict]) -> dict:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "content": row.content,
+        "is_pinned": row.is_pinned,
+        "author": users.get(row.author_id),
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
 
 
-def _build_notice_response(notice: Notice) -> NoticeResponse:
+def _build_notice_response(notice: Notice, users: dict[UUID, dict]) -> NoticeResponse:
     return NoticeResponse(
         id=notice.id,
         title=notice.title,
         content=notice.content,
         is_pinned=notice.is_pinned,
-        author=UserBrief.model_validate(notice.author),
+        author=UserBrief.model_validate(users[notice.author_id]),
         created_at=notice.created_at,
         updated_at=notice.updated_at,
     )
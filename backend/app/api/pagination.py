@@ -0,0 +1,116 @@
+"""
+BAIKAL Groupware AI - Keyset Pagination
+목록 API 공통 커서 기반 페이지네이션
+응답 본문은 기존과 같은 배열이고, 다음 페이지 커서는 X-Next-Cursor / Link 헤더로 전달한다.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Literal, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, Query, Request, Response
+from sqlalchemy import Select, literal, tuple_
+
+from app.core.config import settings
+from app.db.models import UUIDType
+
+
+@dataclass
+class PageParams:
+    limit: Optional[int]  # None이면 전체 (limit/cursor 없이 호출하던 기존 클라이언트)
+    cursor: Optional[list]
+    order: Optional[str]
+
+
+def encode_cursor(values: list) -> str:
+    """정렬 키 값 목록 → URL-safe 커서 문자열"""
+    def encode(value):
+        if isinstance(value, datetime):
+            return {"dt": value.isoformat()}
+        if isinstance(value, UUID):
+            return {"uuid": str(value)}
+        return value
+
+    raw = json.dumps([encode(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    def decode(value):
+        if isinstance(value, dict):
+            if "dt" in value:
+                return datetime.fromisoformat(value["dt"])
+            if "uuid" in value:
+                return UUID(value["uuid"])
+            raise ValueError("unknown cursor value")
+        return value
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list):
+            raise ValueError("cursor must be a list")
+        return [decode(v) for v in values]
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def page_params(
+    limit: Optional[int] = Query(None, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    order: Optional[Literal["asc", "desc"]] = Query(None),
+) -> PageParams:
+    if limit is None and cursor:
+        limit = settings.PAGE_SIZE_DEFAULT
+    return PageParams(
+        limit=limit,
+        cursor=decode_cursor(cursor) if cursor else None,
+        order=order,
+    )
+
+
+def paginate(query: Select, keys: list, params: PageParams, default_order: str = "desc") -> Select:
+    """정렬 키(마지막은 고유 id) 기준으로 커서 이후 limit+1 행을 조회하도록 쿼리 구성 (limit이 없으면 전체)"""
+    descending = (params.order or default_order) == "desc"
+    if params.cursor is not None:
+        if len(params.cursor) != len(keys) or not all(map(_matches_key, keys, params.cursor)):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        position = tuple_(*keys)
+        boundary = tuple_(*[literal(value, key.type) for key, value in zip(keys, params.cursor)])
+        query = query.where(position < boundary if descending else position > boundary)
+    query = query.order_by(*[key.desc() if descending else key.asc() for key in keys])
+    if params.limit is None:
+        return query
+    return query.limit(params.limit + 1)
+
+
+def _matches_key(key, value) -> bool:
+    """커서 값이 정렬 키 컬럼 타입과 맞는지 (잘못된 값이 쿼리까지 가서 500이 나지 않도록)"""
+    if value is None:
+        return False
+    expected = UUID if isinstance(key.type, UUIDType) else key.type.python_type
+    if isinstance(value, bool) and expected is not bool:
+        return False
+    if expected is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, expected)
+
+
+def finish_page(
+    items: list,
+    params: PageParams,
+    key: Callable[[Any], list],
+    request: Request,
+    response: Response,
+) -> list:
+    """limit+1번째 행이 있으면 잘라내고 다음 페이지 커서를 헤더에 설정"""
+    if params.limit is None or len(items) <= params.limit:
+        return items
+    items = items[:params.limit]
+    cursor = encode_cursor(key(items[-1]))
+    response.headers["X-Next-Cursor"] = cursor
+    response.headers["Link"] = f'<{request.url.include_query_params(cursor=cursor)}>; rel="next"'
+    return items
@@ -1,13 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from typing import Literal, Optional
 from uuid import UUID
+from datetime import date, datetime, time, timedelta
 
+from app.core.config import settings
+from app.core.events import notify_schedule
 from app.db.database import get_db
 from app.db.models import Schedule, User
-from app.schemas.schemas import ScheduleCreate, ScheduleResponse, UserBrief
+from app.db.schedule_range import validate_span, overlapping, find_conflicts
+from app.db.user_directory import user_directory
+from app.schemas.schemas import ScheduleCreate, ScheduleResponse, ScheduleCalendarBucket, UserBrief
 from app.api.deps import get_current_user
+from app.api.pagination import PageParams, page_params, paginate, finish_page
+from app.api.lean import json_response
+from app.api.http_cache import conditional
 
 router = APIRouter(prefix="/schedules", tags=["Schedules"])
 
@@ -18,6 +26,26 @@ async def create_schedule(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    """
+    일정 등록
+    내 일정과 시간이 겹치면 409 (겹치는 일정 목록 포함), allow_conflict면 그대로 등록한다.
+    """
+    try:
+        validate_span(req.start_time, req.end_time)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not req.allow_conflict:
+        conflicts = await find_conflicts(db, current_user.id, req.start_time, req.end_time)
+        if conflicts:
+            raise HTTPException(status_code=409, detail={
+                "message": "Schedule conflicts with existing schedules",
+                "conflicts": [
+                    {"id": str(r.id), "title": r.title,
+                     "start_time": r.start_time.isoformat(), "end_time": r.end_time.isoformat()}
+                    for r in conflicts
+                ],
+            })
+    users = await user_directory.briefs(db, [current_user.id])
     schedule = Schedule(
         title=req.title,
         description=req.description or "",
@@ -28,57 +56,135 @@ async def create_schedule(
     )
     db.add(schedule)
     await db.flush()
-
-    result = await db.execute(
-        select(Schedule).options(selectinload(Schedule.creator)).where(Schedule.id == schedule.id)
-    )
-    schedule = result.scalar_one()
-    return _build_schedule_response(schedule)
+    notify_schedule(db, "schedule.created", schedule)
+    return _build_schedule_response(schedule, users)
 
 
-@router.get("", response_model=list[ScheduleResponse])
+@router.get("", response_model=list[ScheduleResponse], dependencies=[conditional("schedules", "users")])
 async def list_schedules(
+    request: Request,
+    response: Response,
+    creator_id: UUID = None,
+    start: Optional[datetime] = Query(None, alias="from", description="이 시각 이후에 끝나는 일정"),
+    end: Optional[datetime] = Query(None, alias="to", description="이 시각 전에 시작하는 일정"),
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Schedule)
-        .options(selectinload(Schedule.creator))
-        .order_by(Schedule.start_time.desc())
-    )
-    return [_build_schedule_response(s) for s in result.scalars().all()]
+    query = _schedule_rows().where(*overlapping(start, end))
+    if creator_id:
+        query = query.where(Schedule.creator_id == creator_id)
+    result = await db.execute(paginate(query, [Schedule.start_time, Schedule.id], page))
+    rows = finish_page(result.all(), page, _schedule_cursor, request, response)
+    users = await user_directory.briefs(db, [r.creator_id for r in rows])
+    return json_response([_schedule_row(r, users) for r in rows], response)
 
 
-@router.get("/my", response_model=list[ScheduleResponse])
+@router.get("/my", response_model=list[ScheduleResponse], dependencies=[conditional("schedules", "users")])
 async def my_schedules(
+    request: Request,
+    response: Response,
+    start: Optional[datetime] = Query(None, alias="from", description="이 시각 이후에 끝나는 일정"),
+    end: Optional[datetime] = Query(None, alias="to", description="이 시각 전에 시작하는 일정"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    query = _schedule_rows().where(Schedule.creator_id == current_user.id, *overlapping(start, end))
+    result = await db.execute(paginate(query, [Schedule.start_time, Schedule.id], page))
+    rows = finish_page(result.all(), page, _schedule_cursor, request, response)
+    users = await user_directory.briefs(db, [r.creator_id for r in rows])
+    return json_response([_schedule_row(r, users) for r in rows], response)
+
+
+@router.get(
+    "/calendar", response_model=list[ScheduleCalendarBucket], dependencies=[conditional("schedules", "users")]
+)
+async def schedule_calendar(
+    response: Response,
+    start: date = Query(..., alias="from", description="첫날"),
+    end: date = Query(..., alias="to", description="마지막 날 다음 날 (미포함)"),
+    unit: Literal["day", "week"] = "day",
+    creator_id: UUID = None,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    """
+    달력 보기: 기간을 일/주 단위 칸으로 나눠 칸마다 겹치는 일정 (기본은 내 일정)
+    주 단위 칸은 월요일부터 시작하고, 여러 칸에 걸친 일정은 걸친 칸마다 들어간다.
+    """
+    if unit == "week":
+        start -= timedelta(days=start.weekday())
+    if end <= start:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    if (end - start).days > settings.SCHEDULE_CALENDAR_MAX_DAYS:
+        raise HTTPException(
+            status_code=400, detail=f"Calendar range is limited to {settings.SCHEDULE_CALENDAR_MAX_DAYS} days"
+        )
+    step = timedelta(days=1 if unit == "day" else 7)
+    range_start = datetime.combine(start, time.min)
+    count = -(-(end - start) // step)
+    range_end = range_start + count * step
+
     result = await db.execute(
-        select(Schedule)
-        .options(selectinload(Schedule.creator))
-        .where(Schedule.creator_id == current_user.id)
-        .order_by(Schedule.start_time.desc())
+        _schedule_rows()
+        .where(Schedule.creator_id == (creator_id or current_user.id), *overlapping(range_start, range_end))
+        .order_by(Schedule.start_time, Schedule.id)
     )
-    return [_build_schedule_response(s) for s in result.scalars().all()]
+    rows = result.all()
+    users = await user_directory.briefs(db, [r.creator_id for r in rows])
+    buckets = [
+        {"start": range_start + i * step, "end": range_start + (i + 1) * step, "schedules": []}
+        for i in range(count)
+    ]
+    for row in rows:
+        item = _schedule_row(row, users)
+        first = max(0, (row.start_time - range_start) // step)
+        last = min(count - 1, (row.end_time - timedelta(microseconds=1) - range_start) // step)
+        for bucket in buckets[first:max(first, last) + 1]:
+            bucket["schedules"].append(item)
+    return json_response(buckets, response)
 
 
-@router.get("/{schedule_id}", response_model=ScheduleResponse)
+@router.get("/{schedule_id}", response_model=ScheduleResponse, dependencies=[conditional("schedules", "users")])
 async def get_schedule(
     schedule_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Schedule).options(selectinload(Schedule.creator)).where(Schedule.id == schedule_id)
-    )
-    schedule = result.scalar_one_or_none()
+    schedule = await db.get(Schedule, schedule_id)
     if not schedule:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    return _build_schedule_response(schedule)
+    users = await user_directory.briefs(db, [schedule.creator_id])
+    return _build_schedule_response(schedule, users)
+
+
+def _schedule_cursor(schedule) -> list:
+    return [schedule.start_time, schedule.id]
+
+
+def _schedule_rows():
+    """목록용 컬럼 조회"""
+    return select(
+        Schedule.id, Schedule.title, Schedule.description, Schedule.start_time,
+        Schedule.end_time, Schedule.location, Schedule.creator_id, Schedule.created_at,
+    )
+
+
+def _schedule_row(row, users: dict[UUID, dict]) -> dict:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "start_time": row.start_time,
+        "end_time": row.end_time,
+        "location": row.location,
+        "creator": users.get(row.creator_id),
+        "created_at": row.created_at,
+    }
 
 
-def _build_schedule_response(schedule: Schedule) -> ScheduleResponse:
+def _build_schedule_response(schedule: Schedule, users: dict[UUID, dict]) -> ScheduleResponse:
     return ScheduleResponse(
         id=schedule.id,
         title=schedule.title,
@@ -86,6 +192,6 @@ def _build_schedule_response(schedule: Schedule) -> ScheduleResponse:
         start_time=schedule.start_time,
         end_time=schedule.end_time,
         location=schedule.location,
-        creator=UserBrief.model_validate(schedule.creator),
+        creator=UserBrief.model_validate(users[schedule.creator_id]),
         created_at=schedule.created_at,
     )
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_
-from sqlalchemy.orm import selectinload
+from typing import Optional
 from uuid import UUID
 
+from app.core.events import notify_task
 from app.db.database import get_db
 from app.db.models import Task, User
+from app.db.user_directory import user_directory
 from app.schemas.schemas import TaskCreate, TaskUpdate, TaskResponse, UserBrief
 from app.api.deps import get_current_user
+from app.api.pagination import PageParams, page_params, paginate, finish_page
+from app.api.lean import json_response
+from app.api.http_cache import conditional
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
@@ -18,6 +23,7 @@ async def create_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    users = await _task_users(db, [current_user.id], req.assignee_id)
     task = Task(
         title=req.title,
         description=req.description or "",
@@ -28,64 +34,69 @@ async def create_task(
     )
     db.add(task)
     await db.flush()
-
-    result = await db.execute(
-        select(Task)
-        .options(selectinload(Task.creator), selectinload(Task.assignee))
-        .where(Task.id == task.id)
-    )
-    task = result.scalar_one()
-    return _build_task_response(task)
+    notify_task(db, "task.created", task)
+    return _build_task_response(task, users)
 
 
-@router.get("", response_model=list[TaskResponse])
+@router.get("", response_model=list[TaskResponse], dependencies=[conditional("tasks", "users")])
 async def list_tasks(
+    request: Request,
+    response: Response,
     status: str = None,
+    priority: str = None,
+    assignee_id: UUID = None,
+    creator_id: UUID = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    query = (
-        select(Task)
-        .options(selectinload(Task.creator), selectinload(Task.assignee))
-        .order_by(Task.created_at.desc())
-    )
+    query = _task_rows()
     if status:
         query = query.where(Task.status == status)
-    result = await db.execute(query)
-    return [_build_task_response(t) for t in result.scalars().all()]
-
-
-@router.get("/my", response_model=list[TaskResponse])
+    if priority:
+        query = query.where(Task.priority == priority)
+    if assignee_id:
+        query = query.where(Task.assignee_id == assignee_id)
+    if creator_id:
+        query = query.where(Task.creator_id == creator_id)
+    result = await db.execute(paginate(query, [Task.created_at, Task.id], page))
+    rows = finish_page(result.all(), page, _task_cursor, request, response)
+    return json_response(await _task_list(db, rows), response)
+
+
+@router.get("/my", response_model=list[TaskResponse], dependencies=[conditional("tasks", "users")])
 async def my_tasks(
+    request: Request,
+    response: Response,
+    status: str = None,
+    priority: str = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Task)
-        .options(selectinload(Task.creator), selectinload(Task.assignee))
-        .where(
-            or_(Task.creator_id == current_user.id, Task.assignee_id == current_user.id)
-        )
-        .order_by(Task.created_at.desc())
+    query = _task_rows().where(
+        or_(Task.creator_id == current_user.id, Task.assignee_id == current_user.id)
     )
-    return [_build_task_response(t) for t in result.scalars().all()]
+    if status:
+        query = query.where(Task.status == status)
+    if priority:
+        query = query.where(Task.priority == priority)
+    result = await db.execute(paginate(query, [Task.created_at, Task.id], page))
+    rows = finish_page(result.all(), page, _task_cursor, request, response)
+    return json_response(await _task_list(db, rows), response)
 
 
-@router.get("/{task_id}", response_model=TaskResponse)
+@router.get("/{task_id}", response_model=TaskResponse, dependencies=[conditional("tasks", "users")])
 async def get_task(
     task_id: UUID,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Task)
-        .options(selectinload(Task.creator), selectinload(Task.assignee))
-        .where(Task.id == task_id)
-    )
-    task = result.scalar_one_or_none()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return _build_task_response(task)
+    users = await _task_users(db, [task.creator_id, task.assignee_id], None)
+    return _build_task_response(task, users)
 
 
 @router.patch("/{task_id}", response_model=TaskResponse)
@@ -95,14 +106,12 @@ async def update_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Task)
-        .options(selectinload(Task.creator), selectinload(Task.assignee))
-        .where(Task.id == task_id)
-    )
-    task = result.scalar_one_or_none()
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    # 변경 전에 조회해야 autoflush로 UPDATE가 나뉘지 않는다
+    users = await _task_users(db, [task.creator_id, task.assignee_id], req.assignee_id)
+    previous_assignee_id = task.assignee_id
 
     if req.title is not None:
         task.title = req.title
@@ -118,18 +127,51 @@ async def update_task(
         task.assignee_id = req.assignee_id
 
     await db.flush()
-    await db.refresh(task)
+    notify_task(db, "task.updated", task, previous_assignee_id)
+    return _build_task_response(task, users)
 
-    result = await db.execute(
-        select(Task)
-        .options(selectinload(Task.creator), selectinload(Task.assignee))
-        .where(Task.id == task.id)
+
+async def _task_users(db: AsyncSession, user_ids: list, assignee_id: Optional[UUID]) -> dict[UUID, dict]:
+    """응답에 쓸 사용자 표 (새로 지정한 담당자가 없는 사용자면 400)"""
+    users = await user_directory.briefs(db, [*user_ids, assignee_id])
+    if assignee_id is not None and assignee_id not in users:
+        raise HTTPException(status_code=400, detail="Assignee not found")
+    return users
+
+
+def _task_cursor(task) -> list:
+    return [task.created_at, task.id]
+
+
+def _task_rows():
+    """목록용 컬럼 조회"""
+    return select(
+        Task.id, Task.title, Task.description, Task.status, Task.priority, Task.due_date,
+        Task.creator_id, Task.assignee_id, Task.created_at, Task.updated_at,
     )
-    task = result.scalar_one()
-    return _build_task_response(task)
 
 
-def _build_task_response(task: Task) -> TaskResponse:
+async def _task_list(db: AsyncSession, rows) -> list[dict]:
+    users = await user_directory.briefs(db, [*(r.creator_id for r in rows), *(r.assignee_id for r in rows)])
+    return [_task_row(row, users) for row in rows]
+
+
+def _task_row(row, users: dict[UUID, dict]) -> dict:
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status,
+        "priority": row.priority,
+        "due_date": row.due_date,
+        "creator": users.get(row.creator_id),
+        "assignee": users.get(row.assignee_id),
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+    }
+
+
+def _build_task_response(task: Task, users: dict[UUID, dict]) -> TaskResponse:
     return TaskResponse(
         id=task.id,
         title=task.title,
@@ -137,8 +179,8 @@ def _build_task_response(task: Task) -> TaskResponse:
         status=task.status,
         priority=task.priority,
         due_date=task.due_date,
-        creator=UserBrief.model_validate(task.creator),
-        assignee=UserBrief.model_validate(task.assignee) if task.assignee else None,
+        creator=UserBrief.model_validate(users[task.creator_id]),
+        assignee=UserBrief.model_validate(users[task.assignee_id]) if task.assignee_id else None,
         created_at=task.created_at,
         updated_at=task.updated_at,
     )
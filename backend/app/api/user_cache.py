@@ -0,0 +1,80 @@
+"""
+BAIKAL Groupware AI - Authenticated User Cache
+get_current_user가 요청마다 users를 조회하지 않도록 사용자 행(컬럼 값)을 캐시한다.
+이 프로세스에서 커밋된 users 변경은 즉시 무효화하고, 다른 워커의 변경은 USER_CACHE_TTL 안에 반영된다.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+from app.core.config import settings
+from app.db.changes import collection_versions
+from app.db.models import User
+
+_COLUMNS = tuple(c.key for c in User.__mapper__.column_attrs)
+
+
+class UserCache:
+    """id → 사용자 컬럼 값 (TTL + LRU)"""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[UUID, tuple[float, dict]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        collection_versions.subscribe(self._on_commit)
+
+    def get(self, db: AsyncSession, user_id: UUID) -> Optional[User]:
+        """
+        캐시된 사용자를 세션에 persistent 상태로 붙여 반환 (SQL 없음)
+        세션에 이미 있으면 그 객체를, 없거나 만료되었으면 None
+        """
+        user = db.identity_map.get(identity_key(User, user_id))
+        if user is not None:
+            return user
+        cached = self._entries.get(user_id)
+        if cached is None or cached[0] <= time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(user_id)
+
+        user = User(**cached[1])
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    def put(self, user: User):
+        self._entries[user.id] = (
+            time.monotonic() + self.ttl,
+            {key: getattr(user, key) for key in _COLUMNS},
+        )
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID):
+        self._entries.pop(user_id, None)
+
+    def _on_commit(self, changes: dict[str, set]):
+        for user_id in changes.get("users", ()):
+            self.invalidate(user_id)
+
+    def metrics(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+user_cache = UserCache(max_entries=settings.USER_CACHE_MAX_ENTRIES, ttl=settings.USER_CACHE_TTL)
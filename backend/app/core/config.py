@@ -5,12 +5,58 @@ from typing import Optional
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./baikal_groupware.db"
+    DB_ECHO: bool = False
+
+    # Connection pool (QueuePool; size + overflow = max connections per worker)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; reconnect before server/LB idle timeouts
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements; 0 behind pgbouncer (transaction mode)
+
+    # SQLite
+    SQLITE_WAL: bool = True
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # NORMAL is durable across app crashes in WAL mode
+    SQLITE_BUSY_TIMEOUT: int = 5000  # ms to wait for the write lock
+    SQLITE_CACHE_SIZE_KB: int = 65536
 
     # JWT
     SECRET_KEY: str = "baikal-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 480  # 8 hours
 
+    # Password hashing (bcrypt runs on a dedicated thread pool)
+    BCRYPT_ROUNDS: int = 12  # hashes with a different cost are rehashed on login
+    PASSWORD_HASH_WORKERS: int = 4  # concurrent hashes; extra logins wait in the queue
+
+    # Authenticated user cache (get_current_user)
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_TTL: float = 60.0  # seconds; bounds staleness across workers
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    USER_DIRECTORY_TTL: float = 300.0  # seconds; UserBrief table used by response builders
+
+    # List endpoints (keyset pagination)
+    PAGE_SIZE_DEFAULT: int = 100  # used when a cursor is sent without limit; no limit/cursor returns the full list
+    PAGE_SIZE_MAX: int = 500
+
+    # Conditional GET (ETag / Last-Modified → 304)
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_WINDOW: float = 30.0  # seconds; validators roll over so other workers' writes show up (0 = single worker)
+
+    # Push notifications (GET /api/events, Server-Sent Events)
+    EVENT_BUS_BACKEND: str = "memory"  # "memory" (single worker), "redis" (REDIS_URL) or "postgres" (LISTEN/NOTIFY)
+    EVENT_CHANNEL: str = "baikal_events"
+    EVENT_QUEUE_SIZE: int = 100  # per stream; a client that falls behind gets a "resync" event
+    EVENT_HEARTBEAT: float = 15.0  # seconds; keeps proxies from closing idle streams
+
+    # Schedules
+    SCHEDULE_MAX_DURATION_DAYS: int = 31  # longer schedules are rejected; bounds range-query index scans (0 = no limit)
+    SCHEDULE_CALENDAR_MAX_DAYS: int = 92  # widest /schedules/calendar range per request
+
+    # Approvals
+    APPROVAL_BULK_MAX_ITEMS: int = 100
+
     # LLM
     LLM_PROVIDER: str = "openai"  # "openai" or "ollama"
     OPENAI_API_KEY: Optional[str] = None
@@ -18,6 +64,45 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://localhost:11434"
     OLLAMA_MODEL: str = "llama3.1:8b"
 
+    # LLM HTTP client (process-wide pool)
+    LLM_HTTP2: bool = True
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    LLM_KEEPALIVE_EXPIRY: float = 60.0  # seconds
+    LLM_CONNECT_TIMEOUT: float = 5.0
+    OPENAI_TIMEOUT: float = 60.0
+    OLLAMA_TIMEOUT: float = 120.0
+
+    # Agent loop
+    AGENT_MAX_STEPS: int = 4  # LLM calls per chat turn
+    AGENT_TOKEN_BUDGET: int = 16000  # total tokens per chat turn
+    AGENT_TURN_TIMEOUT: float = 60.0  # seconds per chat turn
+    # First step sends only relevant tool schemas. Ollama only: openai always gets the full list
+    # (stable prompt-cache prefix), so the default provider sees no tool-schema savings.
+    AGENT_TOOL_SELECTION_ENABLED: bool = True
+    AGENT_TOOL_TOP_K: int = 3
+    USER_INDEX_TTL: float = 300.0  # seconds; agent name index reload interval
+
+    # Chat history cache ("memory": per-process, "redis": shared by workers)
+    CHAT_HISTORY_BACKEND: str = "memory"
+    CHAT_HISTORY_LIMIT: int = 20  # messages per user
+    CHAT_HISTORY_MAX_USERS: int = 1000  # LRU bound (memory backend)
+    CHAT_HISTORY_TTL: int = 3600  # seconds (redis backend)
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Context window
+    CONTEXT_TOKEN_BUDGET: int = 3000  # chat history tokens sent per LLM call
+    CONTEXT_SUMMARY_TOKENS: int = 400  # max tokens of the rolling summary
+
+    # Deterministic intent router (simple list requests skip the LLM)
+    INTENT_ROUTER_ENABLED: bool = True
+
+    # Response cache for read-only agent questions
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL: float = 300.0  # seconds
+    RESPONSE_CACHE_MAX_USERS: int = 1000
+    RESPONSE_CACHE_ENTRIES_PER_USER: int = 20
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,295 @@
+"""
+BAIKAL Groupware AI - Event Bus
+결재/업무 등 변경을 관련 사용자에게 밀어주는 pub/sub (GET /api/events SSE 스트림이 구독한다).
+핸들러와 ToolExecutor는 notify()로 세션에 이벤트를 쌓고, 커밋된 뒤에만 발행된다 (롤백되면 버림).
+백엔드는 EVENT_BUS_BACKEND로 고른다:
+  memory   — 프로세스 안에서만 전달 (워커 1개)
+  redis    — Redis PUBLISH/SUBSCRIBE로 모든 워커에 전달 (redis 패키지 필요)
+  postgres — PostgreSQL LISTEN/NOTIFY로 모든 워커에 전달 (asyncpg 필요)
+"""
+
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+_PENDING_KEY = "pending_events"
+
+
+def notify(db, event_type: str, data: dict, user_ids: Optional[Iterable[Optional[UUID]]] = None):
+    """
+    커밋 후 발행할 이벤트를 세션에 추가
+    user_ids가 None이면 전체 사용자, 아니면 해당 사용자에게만 (None 항목은 무시)
+    """
+    users = None if user_ids is None else sorted({str(u) for u in user_ids if u is not None})
+    if users == []:
+        return
+    db.info.setdefault(_PENDING_KEY, []).append({"type": event_type, "data": data, "users": users})
+
+
+def notify_approval(db, event_type: str, approval):
+    """결재 문서 이벤트 → 작성자와 현재 결재 차례인 사용자"""
+    notify(db, event_type, {
+        "id": approval.id,
+        "title": approval.title,
+        "status": approval.status,
+        "current_step": approval.current_step,
+        "current_approver_id": approval.current_approver_id,
+    }, [approval.author_id, approval.current_approver_id])
+
+
+def notify_task(db, event_type: str, task, previous_assignee_id: Optional[UUID] = None):
+    """업무 이벤트 → 생성자와 담당자 (담당자가 바뀌면 이전 담당자도)"""
+    notify(db, event_type, {
+        "id": task.id,
+        "title": task.title,
+        "status": task.status,
+        "priority": task.priority,
+        "creator_id": task.creator_id,
+        "assignee_id": task.assignee_id,
+    }, [task.creator_id, task.assignee_id, previous_assignee_id])
+
+
+def notify_schedule(db, event_type: str, schedule):
+    """일정 이벤트 → 등록자"""
+    notify(db, event_type, {
+        "id": schedule.id,
+        "title": schedule.title,
+        "start_time": schedule.start_time,
+        "end_time": schedule.end_time,
+    }, [schedule.creator_id])
+
+
+def notify_notice(db, event_type: str, notice):
+    """공지 이벤트 → 전체 사용자"""
+    notify(db, event_type, {
+        "id": notice.id,
+        "title": notice.title,
+        "is_pinned": notice.is_pinned,
+        "author_id": notice.author_id,
+    })
+
+
+class InProcessEventBus:
+    """프로세스 메모리 pub/sub: 사용자별 구독 큐로 바로 전달"""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.overflowed = 0
+
+    async def start(self):
+        pass
+
+    def subscribe(self, user_id) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(str(user_id), set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id, queue: asyncio.Queue):
+        queues = self._subscribers.get(str(user_id))
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[str(user_id)]
+
+    def publish(self, events: list[dict]):
+        """커밋 훅에서 호출 (동기, 블로킹 없음)"""
+        self.published += len(events)
+        for item in events:
+            self._deliver(item)
+
+    def _deliver(self, item: dict):
+        if item["users"] is None:
+            targets = list(self._subscribers.values())
+        else:
+            targets = [self._subscribers[u] for u in item["users"] if u in self._subscribers]
+        message = {"type": item["type"], "data": item["data"]}
+        for queues in targets:
+            for queue in queues:
+                self._put(queue, message)
+
+    def _put(self, queue: asyncio.Queue, message: dict):
+        try:
+            queue.put_nowait(message)
+            self.delivered += 1
+        except asyncio.QueueFull:
+            # 못 따라오는 구독자: 쌓인 이벤트를 버리고 목록을 다시 읽으라고 알린다
+            self.overflowed += 1
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"type": "resync", "data": {}})
+
+    def metrics(self) -> dict:
+        return {
+            "backend": settings.EVENT_BUS_BACKEND,
+            "users": len(self._subscribers),
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflowed": self.overflowed,
+        }
+
+    async def aclose(self):
+        # 열린 스트림을 끝낸다 (종료 시 연결이 남아 있지 않도록)
+        for queues in self._subscribers.values():
+            for queue in queues:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+        self._subscribers.clear()
+
+
+class _BroadcastEventBus(InProcessEventBus, ABC):
+    """
+    워커 간 전달 공통부: 발행은 외부 채널로 보내고, 채널에서 받은 이벤트를 이 프로세스의 구독자에게 전달한다
+    (자기 워커가 발행한 이벤트도 채널을 거쳐 돌아온다)
+    """
+
+    def __init__(self, queue_size: int, channel: str):
+        super().__init__(queue_size)
+        self.channel = channel
+        self._sending: set[asyncio.Task] = set()
+        self.send_errors = 0
+
+    def publish(self, events: list[dict]):
+        self.published += len(events)
+        loop = asyncio.get_running_loop()
+        for item in events:
+            task = loop.create_task(self._send(json.dumps(item, ensure_ascii=False, default=str)))
+            self._sending.add(task)
+            task.add_done_callback(self._sent)
+
+    def _sent(self, task: asyncio.Task):
+        self._sending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.send_errors += 1
+            print(f"⚠️ Event publish failed: {task.exception()!r}")
+
+    def _receive(self, payload):
+        try:
+            self._deliver(json.loads(payload))
+        except (TypeError, ValueError, KeyError):
+            pass
+
+    @abstractmethod
+    async def _send(self, payload: str):
+        """이벤트 한 건(JSON)을 외부 채널로 발행"""
+
+    def metrics(self) -> dict:
+        return {**super().metrics(), "channel": self.channel, "send_errors": self.send_errors}
+
+
+class RedisEventBus(_BroadcastEventBus):
+    """Redis PUBLISH/SUBSCRIBE (redis 패키지 필요)"""
+
+    def __init__(self, url: str, queue_size: int, channel: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("EVENT_BUS_BACKEND=redis requires the 'redis' package") from e
+        super().__init__(queue_size, channel)
+        self._redis = redis.from_url(url)
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message["type"] == "message":
+                        self._receive(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 연결이 끊기면 redis 클라이언트가 다시 연결하며 채널을 재구독한다
+                print(f"⚠️ Event bus listener error: {e!r}")
+                await asyncio.sleep(1.0)
+
+    async def _send(self, payload: str):
+        await self._redis.publish(self.channel, payload)
+
+    async def aclose(self):
+        if self._listener is not None:
+            self._listener.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+        await self._redis.aclose()
+        await super().aclose()
+
+
+class PostgresEventBus(_BroadcastEventBus):
+    """
+    PostgreSQL LISTEN/NOTIFY (asyncpg 필요)
+    LISTEN은 전용 연결 하나를 계속 붙잡고, NOTIFY는 짧게 빌려 쓰는 연결로 보낸다.
+    NOTIFY 페이로드는 8000바이트 이하여야 하므로 이벤트에는 id/제목 정도만 싣는다.
+    """
+
+    def __init__(self, database_url: str, queue_size: int, channel: str):
+        try:
+            import asyncpg
+        except ImportError as e:
+            raise RuntimeError("EVENT_BUS_BACKEND=postgres requires the 'asyncpg' package") from e
+        super().__init__(queue_size, channel)
+        self._asyncpg = asyncpg
+        self._dsn = database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self._listen_conn = None
+        self._send_pool = None
+
+    async def start(self):
+        self._listen_conn = await self._asyncpg.connect(self._dsn)
+        await self._listen_conn.add_listener(self.channel, self._on_notify)
+        self._send_pool = await self._asyncpg.create_pool(self._dsn, min_size=1, max_size=2)
+
+    def _on_notify(self, connection, pid, channel, payload):
+        self._receive(payload)
+
+    async def _send(self, payload: str):
+        await self._send_pool.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+
+    async def aclose(self):
+        if self._listen_conn is not None:
+            await self._listen_conn.close()
+        if self._send_pool is not None:
+            await self._send_pool.close()
+        await super().aclose()
+
+
+def _create_backend():
+    if settings.EVENT_BUS_BACKEND == "redis":
+        return RedisEventBus(settings.REDIS_URL, settings.EVENT_QUEUE_SIZE, settings.EVENT_CHANNEL)
+    if settings.EVENT_BUS_BACKEND == "postgres":
+        return PostgresEventBus(settings.DATABASE_URL, settings.EVENT_QUEUE_SIZE, settings.EVENT_CHANNEL)
+    return InProcessEventBus(settings.EVENT_QUEUE_SIZE)
+
+
+event_bus = _create_backend()
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_events(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        now = time.time()
+        for item in pending:
+            item["data"].setdefault("at", now)
+        event_bus.publish(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_events(session):
+    session.info.pop(_PENDING_KEY, None)
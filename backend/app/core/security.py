@@ -1,10 +1,19 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 비용(rounds)이 설정과 다른 기존 해시는 로그인 시 다시 해싱된다 (verify_and_update)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+# bcrypt 한 번에 수백 ms CPU를 쓰므로 이벤트 루프 밖의 전용 스레드에서 실행한다
+# (bcrypt는 해싱 중 GIL을 놓는다). 워커 수가 동시 해싱 상한이고, 나머지는 대기열에서 기다린다.
+_hash_pool = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -15,6 +24,21 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """(일치 여부, 현재 설정으로 다시 만든 해시 또는 None) — 해시 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, pwd_context.verify_and_update, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, pwd_context.hash, password)
+
+
+def shutdown_hash_pool():
+    _hash_pool.shutdown(wait=False, cancel_futures=True)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (
@@ -0,0 +1,83 @@
+"""
+BAIKAL Groupware AI - 변경 추적
+커밋된 쓰기를 컬렉션 단위 버전으로 집계한다 (캐시 무효화에 사용).
+API 핸들러와 ToolExecutor 모두 ORM으로 쓰기 때문에 세션 이벤트 한 곳에서 잡힌다.
+"""
+
+import time
+from itertools import chain
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# 테이블 → 컬렉션 (결재라인/이력 변경은 결재 문서 변경으로 본다)
+TABLE_COLLECTIONS = {
+    "users": "users",
+    "approvals": "approvals",
+    "approval_lines": "approvals",
+    "approval_logs": "approvals",
+    "tasks": "tasks",
+    "notices": "notices",
+    "schedules": "schedules",
+}
+
+_PENDING_KEY = "changed_collections"
+
+
+class CollectionVersions:
+    """컬렉션별 버전 카운터 (커밋될 때마다 증가)"""
+
+    def __init__(self):
+        self._versions: dict[str, int] = {}
+        self._modified: dict[str, float] = {}
+        self._listeners: list[Callable[[dict[str, set]], None]] = []
+
+    def version(self, collection: str) -> int:
+        return self._versions.get(collection, 0)
+
+    def last_modified(self, collection: str) -> float:
+        """마지막 변경 시각 (epoch seconds, 변경 이력이 없으면 0)"""
+        return self._modified.get(collection, 0.0)
+
+    def snapshot(self, collections) -> dict[str, int]:
+        return {c: self.version(c) for c in collections}
+
+    def subscribe(self, listener: Callable[[dict[str, set]], None]):
+        """커밋 후 {컬렉션: 변경된 id 집합}을 받을 콜백 등록"""
+        self._listeners.append(listener)
+
+    def bump(self, changes: dict[str, set]):
+        now = time.time()
+        for collection in changes:
+            self._versions[collection] = self._versions.get(collection, 0) + 1
+            self._modified[collection] = now
+        for listener in self._listeners:
+            listener(changes)
+
+
+collection_versions = CollectionVersions()
+
+
+@event.listens_for(Session, "after_flush")
+def _record_changes(session, flush_context):
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    # 역참조 컬렉션만 바뀐 객체(예: author=current_user로 User.approvals에 추가)는 변경으로 보지 않는다
+    dirty = (obj for obj in session.dirty if session.is_modified(obj, include_collections=False))
+    for obj in chain(session.new, dirty, session.deleted):
+        collection = TABLE_COLLECTIONS.get(getattr(obj, "__tablename__", None))
+        if collection:
+            ident = getattr(obj, "approval_id", None) or getattr(obj, "id", None)
+            pending.setdefault(collection, set()).add(ident)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changes(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        collection_versions.bump(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    session.info.pop(_PENDING_KEY, None)
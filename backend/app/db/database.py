@@ -1,15 +1,51 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
+from app.db.pool import InstrumentedQueuePool
 
+is_sqlite = settings.DATABASE_URL.startswith("sqlite")
+is_memory = is_sqlite and (":memory:" in settings.DATABASE_URL or settings.DATABASE_URL.rstrip("/").endswith(":"))
+
+engine_kwargs = {"echo": settings.DB_ECHO}
 connect_args = {}
-if settings.DATABASE_URL.startswith("sqlite"):
+if is_sqlite:
     connect_args = {"check_same_thread": False}
+elif settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    # asyncpg 자체 캐시 + SQLAlchemy 어댑터 캐시 (pgbouncer transaction 모드에서는 0)
+    connect_args = {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
+if not is_memory:
+    # 파일 SQLite도 커넥션을 재사용한다 (aiosqlite 기본값 NullPool은 요청마다 연결+스레드를 새로 만든다)
+    engine_kwargs.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False, connect_args=connect_args)
+engine = create_async_engine(settings.DATABASE_URL, connect_args=connect_args, **engine_kwargs)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+if is_sqlite:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        """연결마다 적용되는 SQLite 설정 (WAL은 파일에 유지된다)"""
+        cursor = dbapi_connection.cursor()
+        if settings.SQLITE_WAL and not is_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}")
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.close()
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -1,16 +1,36 @@
 """
 BAIKAL Groupware AI - DB 초기화 및 시드 데이터
 """
-from sqlalchemy import select
-from app.db.database import engine, async_session, Base
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect, select
+from app.db.database import engine, async_session
 from app.db.models import User
 from app.core.security import get_password_hash
 
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# 마이그레이션 도입 전 create_all로 만든 스키마에 해당하는 리비전
+BASELINE_REVISION = "0001"
+
+
+def _run_migrations(connection):
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = connection
+    current = MigrationContext.configure(connection).get_current_revision()
+    if current is None and inspect(connection).has_table("users"):
+        # 기존 DB: 기준 스키마로 표시한 뒤 이후 리비전만 적용
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+
 
 async def init_db():
-    """DB 테이블 생성"""
+    """DB 스키마를 최신 마이그레이션(alembic head)으로 업그레이드"""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_run_migrations)
 
 
 async def seed_data():
@@ -1,25 +1,66 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Integer, TypeDecorator
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Integer, Index, LargeBinary, TypeDecorator
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 import enum
 
 
 class UUIDType(TypeDecorator):
-    """Platform-independent UUID type (works with SQLite and PostgreSQL)."""
-    impl = String(36)
+    """
+    Platform-independent UUID type.
+    PostgreSQL은 네이티브 UUID, SQLite는 16바이트 BLOB, 그 외 DB는 36자 문자열로 저장한다.
+    """
+    impl = LargeBinary(16)
     cache_ok = True
 
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(LargeBinary(16))
+        return dialect.type_descriptor(String(36))
+
     def process_bind_param(self, value, dialect):
-        if value is not None:
-            return str(value)
-        return value
+        if value is None:
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        if dialect.name == "postgresql":
+            return value
+        if dialect.name == "sqlite":
+            return value.bytes
+        return str(value)
 
     def process_result_value(self, value, dialect):
-        if value is not None:
-            return uuid.UUID(value) if not isinstance(value, uuid.UUID) else value
-        return value
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        if isinstance(value, bytes):
+            return uuid.UUID(bytes=value)
+        return uuid.UUID(value)
+
+    def result_processor(self, dialect, coltype):
+        if dialect.name == "postgresql":
+            # 드라이버가 이미 UUID 객체를 반환하므로 행마다 변환할 것이 없다
+            return None
+        if dialect.name == "sqlite":
+            def process(value):
+                if value.__class__ is bytes:
+                    return uuid.UUID(bytes=value)
+                return self.process_result_value(value, dialect)
+            return process
+        return super().result_processor(dialect, coltype)
+
+    def literal_processor(self, dialect):
+        def process(value):
+            value = self.process_bind_param(value, dialect)
+            if value is None:
+                return "NULL"
+            if isinstance(value, bytes):
+                return f"X'{value.hex()}'"
+            return f"'{value}'"
+        return process
 
 
 # ─── Enums ───────────────────────────────────────────
@@ -50,6 +91,9 @@ class TaskStatus(str, enum.Enum):
 # ─── Users ───────────────────────────────────────────
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_active_name", "is_active", "name", "id"),
+    )
 
     id = Column(UUIDType(), primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -73,6 +117,12 @@ class User(Base):
 # ─── Approvals ───────────────────────────────────────
 class Approval(Base):
     __tablename__ = "approvals"
+    __table_args__ = (
+        Index("ix_approvals_author_created", "author_id", "created_at", "id"),
+        Index("ix_approvals_status_created", "status", "created_at", "id"),
+        Index("ix_approvals_created", "created_at", "id"),
+        Index("ix_approvals_current_approver", "current_approver_id", "created_at", "id"),
+    )
 
     id = Column(UUIDType(), primary_key=True, default=uuid.uuid4)
     title = Column(String(300), nullable=False)
@@ -80,6 +130,9 @@ class Approval(Base):
     category = Column(String(100), default="general")
     status = Column(String(20), default="draft", nullable=False)
     author_id = Column(UUIDType(), ForeignKey("users.id"), nullable=False)
+    # 현재 결재 차례 (결재 중일 때만 설정 — 결재 대기함 조회용)
+    current_step = Column(Integer, nullable=True)
+    current_approver_id = Column(UUIDType(), ForeignKey("users.id"), nullable=True)
     created_at = Column(DateTime(), default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
@@ -91,6 +144,10 @@ class Approval(Base):
 
 class ApprovalLine(Base):
     __tablename__ = "approval_lines"
+    __table_args__ = (
+        Index("ix_approval_lines_approver_action", "approver_id", "action", "approval_id"),
+        Index("ix_approval_lines_approval_order", "approval_id", "order"),
+    )
 
     id = Column(UUIDType(), primary_key=True, default=uuid.uuid4)
     approval_id = Column(UUIDType(), ForeignKey("approvals.id"), nullable=False)
@@ -107,6 +164,9 @@ class ApprovalLine(Base):
 
 class ApprovalLog(Base):
     __tablename__ = "approval_logs"
+    __table_args__ = (
+        Index("ix_approval_logs_approval", "approval_id"),
+    )
 
     id = Column(UUIDType(), primary_key=True, default=uuid.uuid4)
     approval_id = Column(UUIDType(), ForeignKey("approvals.id"), nullable=False)
@@ -123,6 +183,12 @@ class ApprovalLog(Base):
 # ─── Tasks ───────────────────────────────────────────
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_creator_created", "creator_id", "created_at", "id"),
+        Index("ix_tasks_assignee_created", "assignee_id", "created_at", "id"),
+        Index("ix_tasks_status_created", "status", "created_at", "id"),
+        Index("ix_tasks_created", "created_at", "id"),
+    )
 
     id = Column(UUIDType(), primary_key=True, default=uuid.uuid4)
     title = Column(String(300), nullable=False)
@@ -143,6 +209,9 @@ class Task(Base):
 # ─── Notices ─────────────────────────────────────────
 class Notice(Base):
     __tablename__ = "notices"
+    __table_args__ = (
+        Index("ix_notices_pinned_created", "is_pinned", "created_at", "id"),
+    )
 
     id = Column(UUIDType(), primary_key=True, default=uuid.uuid4)
     title = Column(String(300), nullable=False)
@@ -159,6 +228,11 @@ class Notice(Base):
 # ─── Schedules ───────────────────────────────────────
 class Schedule(Base):
     __tablename__ = "schedules"
+    __table_args__ = (
+        # 기간 조회/겹침 검사: creator_id 등호 + start_time 범위, end_time은 인덱스에서 바로 거른다
+        Index("ix_schedules_creator_range", "creator_id", "start_time", "end_time"),
+        Index("ix_schedules_start", "start_time", "id"),
+    )
 
     id = Column(UUIDType(), primary_key=True, default=uuid.uuid4)
     title = Column(String(300), nullable=False)
@@ -177,12 +251,27 @@ class Schedule(Base):
 # ─── Chat History ────────────────────────────────────
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        Index("ix_chat_messages_user_created", "user_id", "created_at"),
+    )
 
     id = Column(UUIDType(), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUIDType(), ForeignKey("users.id"), nullable=False)
     role = Column(String(20), nullable=False)
     content = Column(Text, nullable=False)
     tool_calls = Column(Text, nullable=True)
+    token_count = Column(Integer, nullable=True)
     created_at = Column(DateTime(), default=lambda: datetime.now(timezone.utc))
 
     user = relationship("User")
+
+
+class ChatSummary(Base):
+    """오래된 대화의 누적 요약 (사용자당 1행)"""
+    __tablename__ = "chat_summaries"
+
+    user_id = Column(UUIDType(), ForeignKey("users.id"), primary_key=True)
+    content = Column(Text, nullable=False, default="")
+    token_count = Column(Integer, nullable=False, default=0)
+    covered_until = Column(DateTime(), nullable=False)
+    updated_at = Column(DateTime(), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
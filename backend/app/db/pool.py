@@ -0,0 +1,70 @@
+"""
+BAIKAL Groupware AI - Connection Pool Metrics
+커넥션 체크아웃 대기 시간과 타임아웃을 집계하는 QueuePool (관리자 API에서 조회).
+풀이 재생성(engine.dispose)되어도 누적 값이 유지되도록 통계는 모듈 단위로 둔다.
+"""
+
+import statistics
+import time
+from collections import deque
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolStats:
+    """체크아웃 횟수/대기 시간/타임아웃 누적 (최근 window건의 대기 시간으로 백분위 계산)"""
+
+    def __init__(self, window: int = 1000):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.max_wait = 0.0
+        self.peak_checked_out = 0
+        self._waits: deque[float] = deque(maxlen=window)
+
+    def record_checkout(self, waited: float, checked_out: int):
+        self.checkouts += 1
+        self._waits.append(waited)
+        self.max_wait = max(self.max_wait, waited)
+        self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def snapshot(self, pool) -> dict:
+        waits = sorted(self._waits)
+        p95 = waits[int(len(waits) * 0.95)] if waits else 0.0
+        return {
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+            "peak_checked_out": self.peak_checked_out,
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "timeouts": self.timeouts,
+            "wait_ms": {
+                "p50": round(statistics.median(waits) * 1000, 2) if waits else 0.0,
+                "p95": round(p95 * 1000, 2),
+                "max": round(self.max_wait * 1000, 2),
+            },
+        }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        pool_stats.record_checkout(time.perf_counter() - started, self.checkedout())
+        return connection
+
+    def _create_connection(self):
+        pool_stats.connects += 1
+        return super()._create_connection()
@@ -0,0 +1,79 @@
+"""
+BAIKAL Groupware AI - Schedule Range Queries
+기간 조회(달력/목록 from~to)와 일정 겹침 검사의 공통 조건.
+[from, to)와 겹치는 일정 = start_time < to AND end_time > from.
+새 일정은 SCHEDULE_MAX_DURATION_DAYS 이하로 제한하고, 제한 전에 저장된 더 긴 일정은 시작 시 load_longest_span으로
+읽어 둔다. 둘 중 긴 쪽으로 start_time의 아래쪽 경계(from - 최대 길이)가 정해져
+(creator_id, start_time, end_time) 인덱스에서 start_time 범위 하나만 훑는다 (지난 일정이 많아도 조회 범위가 커지지 않는다).
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models import Schedule
+
+# 저장된 일정 중 가장 긴 기간 (None이면 아직 모름 → 아래쪽 경계를 두지 않는다)
+_longest_stored: Optional[timedelta] = None
+
+
+def validate_span(start_time: datetime, end_time: datetime):
+    """등록할 일정 기간 검사 (잘못되면 ValueError)"""
+    if end_time <= start_time:
+        raise ValueError("end_time must be after start_time")
+    max_days = settings.SCHEDULE_MAX_DURATION_DAYS
+    if max_days and end_time - start_time > timedelta(days=max_days):
+        raise ValueError(f"Schedule cannot be longer than {max_days} days")
+
+
+async def load_longest_span(db: AsyncSession):
+    """저장된 일정 중 가장 긴 기간을 읽어 둔다 (시작 시 1회, 이후 등록은 validate_span이 제한)"""
+    global _longest_stored
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        seconds = (func.julianday(Schedule.end_time) - func.julianday(Schedule.start_time)) * 86400
+    elif dialect == "postgresql":
+        seconds = func.extract("epoch", Schedule.end_time - Schedule.start_time)
+    else:
+        return
+    longest = (await db.execute(select(func.max(seconds)))).scalar()
+    _longest_stored = timedelta(seconds=math.ceil(longest or 0))  # julianday 오차로 짧아지지 않게 올림
+
+
+def _max_span() -> Optional[timedelta]:
+    """겹침 조회에서 가정할 수 있는 일정 최대 길이 (없으면 None)"""
+    max_days = settings.SCHEDULE_MAX_DURATION_DAYS
+    if not max_days or _longest_stored is None:
+        return None
+    return max(timedelta(days=max_days), _longest_stored)
+
+
+def overlapping(start: datetime = None, end: datetime = None) -> list:
+    """[start, end)와 겹치는 일정 조건 (어느 한쪽이 None이면 그쪽은 열린 구간)"""
+    conditions = []
+    if end is not None:
+        conditions.append(Schedule.start_time < end)
+    if start is not None:
+        conditions.append(Schedule.end_time > start)
+        max_span = _max_span()
+        if max_span is not None:
+            conditions.append(Schedule.start_time >= start - max_span)
+    return conditions
+
+
+async def find_conflicts(
+    db: AsyncSession, creator_id: UUID, start_time: datetime, end_time: datetime, limit: int = 5,
+) -> list:
+    """같은 사용자의 겹치는 일정 (id, title, start_time, end_time 행, 시작 시각순)"""
+    result = await db.execute(
+        select(Schedule.id, Schedule.title, Schedule.start_time, Schedule.end_time)
+        .where(Schedule.creator_id == creator_id, *overlapping(start_time, end_time))
+        .order_by(Schedule.start_time, Schedule.id)
+        .limit(limit)
+    )
+    return result.all()
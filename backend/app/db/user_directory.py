@@ -0,0 +1,63 @@
+"""
+BAIKAL Groupware AI - User Directory
+응답의 작성자/담당자/결재자(UserBrief)를 채우는 프로세스 단위 id → UserBrief 표.
+목록/상세 조회가 users를 조인하거나 selectinload하지 않고 여기서 찾는다.
+이 프로세스에서 커밋된 users 변경은 해당 항목만 지워 다음 조회 때 다시 읽고,
+다른 워커의 변경은 USER_DIRECTORY_TTL마다 표를 비워 반영한다.
+"""
+
+import time
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.changes import collection_versions
+from app.db.models import User
+
+
+class UserDirectory:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._briefs: dict[UUID, dict] = {}
+        self._reset_at = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        collection_versions.subscribe(self._on_commit)
+
+    async def briefs(self, db: AsyncSession, user_ids: Iterable[Optional[UUID]]) -> dict[UUID, dict]:
+        """
+        요청한 사용자들의 id → UserBrief dict (호출마다 새 dict, 항목 dict는 읽기 전용으로 쓸 것)
+        없는 사용자만 한 번에 조회해 채운다.
+        """
+        if time.monotonic() - self._reset_at > self.ttl:
+            self._briefs = {}
+            self._reset_at = time.monotonic()
+        wanted = {user_id for user_id in user_ids if user_id is not None}
+        # 조회를 기다리는 동안 커밋 훅이 공유 표에서 항목을 지울 수 있으므로 결과는 따로 모은다
+        found = {user_id: self._briefs[user_id] for user_id in wanted if user_id in self._briefs}
+        missing = wanted - found.keys()
+        if missing:
+            self.misses += len(missing)
+            result = await db.execute(
+                select(User.id, User.name, User.department, User.position).where(User.id.in_(missing))
+            )
+            for user_id, name, department, position in result.all():
+                found[user_id] = self._briefs[user_id] = {
+                    "id": user_id, "name": name, "department": department or "", "position": position or "",
+                }
+        else:
+            self.hits += 1
+        return found
+
+    def _on_commit(self, changes: dict[str, set]):
+        for user_id in changes.get("users", ()):
+            self._briefs.pop(user_id, None)
+
+    def metrics(self) -> dict:
+        return {"entries": len(self._briefs), "hits": self.hits, "misses": self.misses}
+
+
+user_directory = UserDirectory(ttl=settings.USER_DIRECTORY_TTL)
@@ -7,13 +7,23 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.config import settings
+from app.core.security import shutdown_hash_pool
+from app.core.events import event_bus
+from app.db.database import async_session, engine
 from app.db.init_db import init_db, seed_data
+from app.db.schedule_range import load_longest_span
+from app.agent.llm import llm_clients
+from app.agent.memory import chat_history
+from app.agent.response_cache import response_cache
 from app.api.auth import router as auth_router
 from app.api.approvals import router as approvals_router
 from app.api.tasks import router as tasks_router
 from app.api.notices import router as notices_router
 from app.api.schedules import router as schedules_router
 from app.api.chat import router as chat_router
+from app.api.admin import router as admin_router
+from app.api.events import router as events_router
 
 
 @asynccontextmanager
@@ -22,10 +32,23 @@ async def lifespan(app: FastAPI):
     print("🚀 BAIKAL Groupware AI Starting...")
     await init_db()
     await seed_data()
+    async with async_session() as db:
+        await load_longest_span(db)
     print("✅ Database initialized")
+    # 키가 없어도 그룹웨어는 뜨고, AI 채팅만 요청 시점에 오류를 낸다
+    if llm_clients.is_configured():
+        llm_clients.get()
+    else:
+        print(f"⚠️ LLM provider '{settings.LLM_PROVIDER}' is not configured (AI chat disabled)")
+    await event_bus.start()
     yield
     # Shutdown
     print("👋 BAIKAL Groupware AI Shutting down...")
+    await event_bus.aclose()
+    await llm_clients.aclose()
+    await chat_history.aclose()
+    shutdown_hash_pool()
+    await engine.dispose()
 
 
 app = FastAPI(
@@ -42,6 +65,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Link", "ETag", "Last-Modified"],
 )
 
 # Routes
@@ -51,8 +75,21 @@ app.include_router(tasks_router, prefix="/api")
 app.include_router(notices_router, prefix="/api")
 app.include_router(schedules_router, prefix="/api")
 app.include_router(chat_router, prefix="/api")
+app.include_router(admin_router, prefix="/api")
+app.include_router(events_router, prefix="/api")
 
 
 @app.get("/api/health")
 async def health_check():
     return {"status": "ok", "service": "BAIKAL Groupware AI"}
+
+
+@app.get("/api/health/llm")
+async def llm_pool_metrics():
+    return {
+        "provider": settings.LLM_PROVIDER,
+        "status": "ok" if llm_clients.is_configured() else "not configured",
+        "pools": llm_clients.metrics(),
+        "prompt_cache": llm_clients.prompt_cache_metrics(),
+        "response_cache": response_cache.metrics(),
+    }
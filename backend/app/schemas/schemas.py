@@ -65,6 +65,8 @@ class ApprovalResponse(BaseModel):
     category: str
     status: str
     author: UserBrief
+    current_step: Optional[int] = None
+    current_approver_id: Optional[UUID] = None
     created_at: datetime
     updated_at: datetime
     approval_lines: list["ApprovalLineResponse"] = []
@@ -90,6 +92,31 @@ class ApprovalActionRequest(BaseModel):
     comment: Optional[str] = ""
 
 
+class ApprovalBulkActionItem(BaseModel):
+    approval_id: UUID
+    action: str  # approved, rejected
+    comment: Optional[str] = ""
+
+
+class ApprovalBulkActionRequest(BaseModel):
+    items: list[ApprovalBulkActionItem]
+
+
+class ApprovalBulkActionResult(BaseModel):
+    approval_id: UUID
+    success: bool
+    status_code: int
+    status: Optional[str] = None  # 처리 후 문서 상태
+    current_step: Optional[int] = None
+    error: Optional[str] = None
+
+
+class ApprovalBulkActionResponse(BaseModel):
+    results: list[ApprovalBulkActionResult]
+    succeeded: int
+    failed: int
+
+
 # ─── Task ─────────────────────────────────────────────
 class TaskCreate(BaseModel):
     title: str
@@ -151,6 +178,7 @@ class ScheduleCreate(BaseModel):
     start_time: datetime
     end_time: datetime
     location: Optional[str] = ""
+    allow_conflict: bool = False  # 겹치는 내 일정이 있어도 등록 (기본은 409)
 
 
 class ScheduleResponse(BaseModel):
@@ -167,6 +195,12 @@ class ScheduleResponse(BaseModel):
         from_attributes = True
 
 
+class ScheduleCalendarBucket(BaseModel):
+    start: datetime
+    end: datetime
+    schedules: list[ScheduleResponse]
+
+
 # ─── Chat ─────────────────────────────────────────────
 class ChatRequest(BaseModel):
     message: str
@@ -175,6 +209,8 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     reply: str
     tool_results: Optional[list[dict]] = None
+    steps: Optional[list[dict]] = None
+    usage: Optional[dict] = None
 
 
 # Forward references
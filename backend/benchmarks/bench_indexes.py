@@ -0,0 +1,210 @@
+"""
+BAIKAL Groupware AI - 인덱스 벤치마크
+hot path 조회를 0003 마이그레이션(복합 인덱스) 적용 전/후로 측정한다.
+
+    cd backend
+    python benchmarks/bench_indexes.py --rows 1000000
+
+임시 SQLite 파일에 리비전 0002까지 적용하고 합성 데이터를 넣은 뒤 측정하고,
+같은 DB를 0003으로 올려 다시 측정한다. 쿼리는 app/api/*.py, app/agent/executor.py의 형태와 같다.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_DIR))
+
+_tmp_dir = tempfile.mkdtemp(prefix="baikal-bench-")
+DB_PATH = os.path.join(_tmp_dir, "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{DB_PATH}"
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from sqlalchemy import create_engine, or_, select, text  # noqa: E402
+
+from app.db.models import Approval, ApprovalLine, Schedule, Task, User  # noqa: E402
+
+PAGE = 100
+BASE_REVISION = "0002"
+INDEX_REVISION = "0003"
+
+# 0003 시점 스키마에 있는 컬럼만 조회한다 (엔티티 전체를 고르면 이후 리비전이 추가한 컬럼 때문에 실패)
+APPROVAL_COLUMNS = (
+    Approval.id, Approval.title, Approval.content, Approval.category, Approval.status,
+    Approval.author_id, Approval.created_at, Approval.updated_at,
+)
+LINE_COLUMNS = (
+    ApprovalLine.approval_id, ApprovalLine.id, ApprovalLine.approver_id, ApprovalLine.order,
+    ApprovalLine.action, ApprovalLine.comment, ApprovalLine.acted_at,
+)
+TASK_COLUMNS = (
+    Task.id, Task.title, Task.description, Task.status, Task.priority, Task.due_date,
+    Task.creator_id, Task.assignee_id, Task.created_at, Task.updated_at,
+)
+SCHEDULE_COLUMNS = (
+    Schedule.id, Schedule.title, Schedule.description, Schedule.start_time, Schedule.end_time,
+    Schedule.location, Schedule.creator_id, Schedule.created_at, Schedule.updated_at,
+)
+
+
+def _alembic(connection, revision: str):
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.attributes["connection"] = connection
+    command.upgrade(config, revision)
+
+
+def _seed(engine, rows: int, users: int):
+    rng = random.Random(42)
+    start = datetime(2020, 1, 1)
+    user_ids = [str(uuid.uuid4()) for _ in range(users)]
+
+    def stamp():
+        return start + timedelta(seconds=rng.randrange(200_000_000))
+
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"id": uid, "email": f"user{i}@baikal.ai", "hashed_password": "x", "name": f"사용자{i}",
+             "department": "", "position": "", "role": "user", "is_active": True}
+            for i, uid in enumerate(user_ids)
+        ])
+
+    batch = 50_000
+    for offset in range(0, rows, batch):
+        n = min(batch, rows - offset)
+        approvals, lines, tasks, schedules = [], [], [], []
+        for _ in range(n):
+            approval_id = str(uuid.uuid4())
+            status = rng.choices(["draft", "pending", "approved", "rejected"], [1, 2, 6, 1])[0]
+            created = stamp()
+            approvals.append({
+                "id": approval_id, "title": "결재", "content": "", "category": "general",
+                "status": status, "author_id": rng.choice(user_ids), "created_at": created,
+            })
+            lines.append({
+                "id": str(uuid.uuid4()), "approval_id": approval_id, "approver_id": rng.choice(user_ids),
+                "order": 1, "action": "pending" if status in ("draft", "pending") else status,
+            })
+            tasks.append({
+                "id": str(uuid.uuid4()), "title": "업무", "description": "",
+                "status": rng.choice(["todo", "in_progress", "done"]), "priority": "medium",
+                "creator_id": rng.choice(user_ids), "assignee_id": rng.choice(user_ids), "created_at": stamp(),
+            })
+            begin = stamp()
+            schedules.append({
+                "id": str(uuid.uuid4()), "title": "일정", "description": "", "location": "",
+                "start_time": begin, "end_time": begin + timedelta(hours=1), "creator_id": rng.choice(user_ids),
+            })
+        with engine.begin() as conn:
+            conn.execute(Approval.__table__.insert(), approvals)
+            conn.execute(ApprovalLine.__table__.insert(), lines)
+            conn.execute(Task.__table__.insert(), tasks)
+            conn.execute(Schedule.__table__.insert(), schedules)
+        print(f"  seeded {offset + n:,}/{rows:,}", end="\r", flush=True)
+    print()
+    return user_ids
+
+
+def _queries(user_id: str) -> dict:
+    return {
+        "approvals/my": (
+            select(*APPROVAL_COLUMNS).where(Approval.author_id == user_id)
+            .order_by(Approval.created_at.desc(), Approval.id.desc()).limit(PAGE + 1)
+        ),
+        "approvals?status=pending": (
+            select(*APPROVAL_COLUMNS).where(Approval.status == "pending")
+            .order_by(Approval.created_at.desc(), Approval.id.desc()).limit(PAGE + 1)
+        ),
+        "approvals/pending": (
+            select(*APPROVAL_COLUMNS).join(ApprovalLine)
+            .where(
+                ApprovalLine.approver_id == user_id,
+                ApprovalLine.action == "pending",
+                Approval.status == "pending",
+            )
+            .order_by(Approval.created_at.desc(), Approval.id.desc()).limit(PAGE + 1)
+        ),
+        "approval lines (selectinload)": (
+            select(*LINE_COLUMNS).where(ApprovalLine.approval_id.in_(
+                select(Approval.id).where(Approval.author_id == user_id).limit(PAGE).scalar_subquery()
+            ))
+        ),
+        "tasks/my": (
+            select(*TASK_COLUMNS).where(or_(Task.creator_id == user_id, Task.assignee_id == user_id))
+            .order_by(Task.created_at.desc(), Task.id.desc()).limit(PAGE + 1)
+        ),
+        "tasks?status=todo": (
+            select(*TASK_COLUMNS).where(Task.status == "todo")
+            .order_by(Task.created_at.desc(), Task.id.desc()).limit(PAGE + 1)
+        ),
+        "schedules/my": (
+            select(*SCHEDULE_COLUMNS).where(Schedule.creator_id == user_id)
+            .order_by(Schedule.start_time.desc(), Schedule.id.desc()).limit(PAGE + 1)
+        ),
+    }
+
+
+def _measure(engine, user_ids: list[str], repeat: int) -> dict:
+    rng = random.Random(7)
+    samples: dict[str, list[float]] = {}
+    plans: dict[str, str] = {}
+    with engine.connect() as conn:
+        for i in range(repeat):
+            for name, query in _queries(rng.choice(user_ids)).items():
+                started = time.perf_counter()
+                conn.execute(query).all()
+                samples.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+                if i == 0:
+                    compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+                    rows = conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+                    plans[name] = "; ".join(row[-1] for row in rows)
+    return {name: (statistics.median(values), plans[name]) for name, values in samples.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="결재/업무/일정 테이블별 행 수")
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite:///{DB_PATH}")
+    with engine.begin() as conn:
+        _alembic(conn, BASE_REVISION)
+
+    print(f"seeding {args.rows:,} rows per table into {DB_PATH}")
+    user_ids = _seed(engine, args.rows, args.users)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+    before = _measure(engine, user_ids, args.repeat)
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        _alembic(conn, INDEX_REVISION)
+        conn.execute(text("ANALYZE"))
+    print(f"0003 migration (index build): {time.perf_counter() - started:.1f}s")
+
+    after = _measure(engine, user_ids, args.repeat)
+
+    print(f"\n{'query':<32}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name, (ms_before, _) in before.items():
+        ms_after, plan = after[name]
+        print(f"{name:<32}{ms_before:>12.2f}{ms_after:>12.2f}{ms_before / ms_after:>9.0f}x")
+        print(f"    plan: {plan}")
+
+    engine.dispose()
+    os.remove(DB_PATH)
+    os.rmdir(_tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
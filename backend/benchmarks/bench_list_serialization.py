@@ -0,0 +1,181 @@
+"""
+BAIKAL Groupware AI - 목록 응답 직렬화 벤치마크
+목록 한 페이지를 만드는 두 경로를 비교한다.
+  ORM: 엔티티 + selectinload → _build_*_response → response_model 검증/직렬화 → json.dumps (FastAPI 기본 경로)
+  lean: 필요한 컬럼만 조회 → 행 dict (UserBrief는 user_directory 표) → pydantic_core.to_json (app/api/lean.py)
+
+    cd backend
+    python benchmarks/bench_list_serialization.py --page 500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pydantic import TypeAdapter  # noqa: E402
+from pydantic_core import to_json  # noqa: E402
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session, selectinload  # noqa: E402
+
+from app.db.database import Base  # noqa: E402
+from app.db.models import Approval, ApprovalLine, Notice, Task, User  # noqa: E402
+from app.schemas.schemas import ApprovalResponse, NoticeResponse, TaskResponse  # noqa: E402
+from app.api import approvals, notices, tasks  # noqa: E402
+
+# FastAPI가 엔드포인트마다 한 번 만드는 response_model 필드에 해당
+APPROVALS = TypeAdapter(list[ApprovalResponse])
+TASKS = TypeAdapter(list[TaskResponse])
+NOTICES = TypeAdapter(list[NoticeResponse])
+
+
+def _seed(engine, rows: int):
+    now = datetime(2026, 1, 1)
+    users = [
+        {"id": uuid.uuid4(), "email": f"user{i}@baikal.ai", "hashed_password": "x", "name": f"사용자{i}",
+         "department": "개발팀", "position": "선임", "role": "user", "is_active": True}
+        for i in range(50)
+    ]
+    approval_rows, line_rows, task_rows, notice_rows = [], [], [], []
+    for i in range(rows):
+        author, approver = users[i % 50]["id"], users[(i + 7) % 50]["id"]
+        created = now + timedelta(minutes=i)
+        approval_id = uuid.uuid4()
+        approval_rows.append({
+            "id": approval_id, "title": f"결재 {i}", "content": "내용", "category": "general",
+            "status": "pending", "author_id": author, "current_step": 1, "current_approver_id": approver,
+            "created_at": created, "updated_at": created,
+        })
+        for order, line_approver in enumerate((approver, users[(i + 9) % 50]["id"]), start=1):
+            line_rows.append({
+                "id": uuid.uuid4(), "approval_id": approval_id, "approver_id": line_approver,
+                "order": order, "action": "pending", "comment": "",
+            })
+        task_rows.append({
+            "id": uuid.uuid4(), "title": f"업무 {i}", "description": "설명", "status": "todo",
+            "priority": "medium", "due_date": created, "creator_id": author,
+            "assignee_id": approver if i % 3 else None, "created_at": created, "updated_at": created,
+        })
+        notice_rows.append({
+            "id": uuid.uuid4(), "title": f"공지 {i}", "content": "내용" * 20, "is_pinned": i % 10 == 0,
+            "author_id": author, "created_at": created, "updated_at": created,
+        })
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), users)
+        conn.execute(Approval.__table__.insert(), approval_rows)
+        conn.execute(ApprovalLine.__table__.insert(), line_rows)
+        conn.execute(Task.__table__.insert(), task_rows)
+        conn.execute(Notice.__table__.insert(), notice_rows)
+
+
+def _dumps(adapter: TypeAdapter, content) -> bytes:
+    """FastAPI response_model 경로: 검증 → JSON 모드 dump → JSONResponse.render"""
+    value = adapter.dump_python(adapter.validate_python(content), mode="json")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="baikal-bench-")
+    db_path = os.path.join(tmp_dir, "lists.db")
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+    _seed(engine, args.page)
+    with Session(engine) as session:
+        # user_directory가 채워진 상태 (요청마다 추가 조회 없음)
+        users = {
+            row.id: {"id": row.id, "name": row.name, "department": row.department, "position": row.position}
+            for row in session.execute(select(User.id, User.name, User.department, User.position))
+        }
+
+    def orm_approvals():
+        with Session(engine) as session:
+            items = session.execute(
+                select(Approval)
+                .options(
+                    selectinload(Approval.author),
+                    selectinload(Approval.approval_lines).selectinload(ApprovalLine.approver),
+                )
+                .order_by(Approval.created_at.desc(), Approval.id.desc()).limit(args.page)
+            ).scalars().all()
+            return _dumps(APPROVALS, [approvals._build_approval_response(a, users) for a in items])
+
+    def lean_approvals():
+        with Session(engine) as session:
+            rows = session.execute(
+                approvals._approval_rows()
+                .order_by(Approval.created_at.desc(), Approval.id.desc()).limit(args.page)
+            ).all()
+            line_rows = session.execute(approvals._approval_line_rows([row.id for row in rows])).all()
+            return to_json(approvals._approval_dicts(rows, line_rows, users))
+
+    def orm_tasks():
+        with Session(engine) as session:
+            items = session.execute(
+                select(Task).options(selectinload(Task.creator), selectinload(Task.assignee))
+                .order_by(Task.created_at.desc(), Task.id.desc()).limit(args.page)
+            ).scalars().all()
+            return _dumps(TASKS, [tasks._build_task_response(t, users) for t in items])
+
+    def lean_tasks():
+        with Session(engine) as session:
+            rows = session.execute(
+                tasks._task_rows().order_by(Task.created_at.desc(), Task.id.desc()).limit(args.page)
+            ).all()
+            return to_json([tasks._task_row(r, users) for r in rows])
+
+    def orm_notices():
+        with Session(engine) as session:
+            items = session.execute(
+                select(Notice).options(selectinload(Notice.author))
+                .order_by(Notice.is_pinned.desc(), Notice.created_at.desc(), Notice.id.desc()).limit(args.page)
+            ).scalars().all()
+            return _dumps(NOTICES, [notices._build_notice_response(n, users) for n in items])
+
+    def lean_notices():
+        with Session(engine) as session:
+            rows = session.execute(
+                notices._notice_rows()
+                .order_by(Notice.is_pinned.desc(), Notice.created_at.desc(), Notice.id.desc()).limit(args.page)
+            ).all()
+            return to_json([notices._notice_row(r, users) for r in rows])
+
+    print(f"page of {args.page} rows, median of {args.repeat}\n")
+    print(f"{'':<12}{'ORM (ms)':>12}{'lean (ms)':>12}{'ratio':>8}")
+    for label, orm, lean in (
+        ("approvals", orm_approvals, lean_approvals),
+        ("tasks", orm_tasks, lean_tasks),
+        ("notices", orm_notices, lean_notices),
+    ):
+        assert json.loads(orm()) == json.loads(lean()), label
+        orm_ms, lean_ms = _timed(orm, args.repeat), _timed(lean, args.repeat)
+        print(f"{label:<12}{orm_ms:>12.1f}{lean_ms:>12.1f}{orm_ms / lean_ms:>7.2f}x")
+
+    engine.dispose()
+    os.remove(db_path)
+    os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
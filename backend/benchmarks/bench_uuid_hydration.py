@@ -0,0 +1,148 @@
+"""
+BAIKAL Groupware AI - UUID 저장 형식 벤치마크
+기존 UUIDType(36자 문자열 + 행마다 uuid.UUID(str) 파싱)과 현재 UUIDType(SQLite 16바이트 BLOB)의
+행 하이드레이션 속도와 테이블/인덱스 크기를 비교한다.
+
+    cd backend
+    python benchmarks/bench_uuid_hydration.py --rows 200000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import Column, DateTime, Index, String, TypeDecorator, create_engine, select, text  # noqa: E402
+from sqlalchemy.orm import DeclarativeBase, Session  # noqa: E402
+
+from app.db.models import UUIDType  # noqa: E402
+
+
+class LegacyUUIDType(TypeDecorator):
+    """0004 마이그레이션 이전의 UUIDType"""
+    impl = String(36)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None:
+            return str(value)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None:
+            return uuid.UUID(value) if not isinstance(value, uuid.UUID) else value
+        return value
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+def _model(name: str, uuid_type):
+    """approvals와 같은 형태(UUID 컬럼 2개 + 인덱스)의 테이블"""
+    return type(name, (Base,), {
+        "__tablename__": name,
+        "__table_args__": (Index(f"ix_{name}_author_created", "author_id", "created_at"),),
+        "id": Column(uuid_type(), primary_key=True),
+        "author_id": Column(uuid_type(), nullable=False),
+        "title": Column(String(300), nullable=False),
+        "created_at": Column(DateTime()),
+    })
+
+
+LegacyRow = _model("legacy_rows", LegacyUUIDType)
+NativeRow = _model("native_rows", UUIDType)
+
+
+def _timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="baikal-bench-")
+    db_path = os.path.join(tmp_dir, "uuid.db")
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+
+    now = datetime.now(timezone.utc)
+    authors = [uuid.uuid4() for _ in range(1000)]
+    rows = [
+        {"id": uuid.uuid4(), "author_id": authors[i % len(authors)], "title": "결재", "created_at": now}
+        for i in range(args.rows)
+    ]
+    with engine.begin() as conn:
+        for model in (LegacyRow, NativeRow):
+            conn.execute(model.__table__.insert(), rows)
+    with engine.connect() as conn:
+        sizes = dict(conn.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")).all())
+
+    results = {}
+    for label, model in (("String(36)", LegacyRow), ("BLOB(16)", NativeRow)):
+        table = model.__table__
+
+        def core():
+            with engine.connect() as conn:
+                conn.execute(select(table.c.id, table.c.author_id)).all()
+
+        def orm():
+            with Session(engine) as session:
+                session.execute(select(model)).scalars().all()
+
+        def lookup():
+            with engine.connect() as conn:
+                for author in authors[:200]:
+                    conn.execute(
+                        select(table.c.id).where(table.c.author_id == author)
+                        .order_by(table.c.created_at.desc()).limit(20)
+                    ).all()
+
+        results[label] = {
+            "core": _timed(core, args.repeat),
+            "orm": _timed(orm, args.repeat),
+            "lookup": _timed(lookup, args.repeat),
+            "table": sizes.get(table.name, 0),
+            "pk": sizes.get(f"sqlite_autoindex_{table.name}_1", 0),
+            "index": sizes.get(f"ix_{table.name}_author_created", 0),
+        }
+
+    print(f"{args.rows:,} rows\n")
+    print(f"{'':<28}{'String(36)':>14}{'BLOB(16)':>14}{'ratio':>8}")
+    lines = [
+        ("Core fetch, UUID cols (ms)", "core"),
+        ("ORM hydration (ms)", "orm"),
+        ("200 indexed lookups (ms)", "lookup"),
+        ("table size (KiB)", "table"),
+        ("primary key index (KiB)", "pk"),
+        ("(author_id, created_at) (KiB)", "index"),
+    ]
+    for title, key in lines:
+        legacy, native = results["String(36)"][key], results["BLOB(16)"][key]
+        if key in ("table", "pk", "index"):
+            legacy, native = legacy / 1024, native / 1024
+        ratio = legacy / native if native else 0
+        print(f"{title:<28}{legacy:>14.1f}{native:>14.1f}{ratio:>7.2f}x")
+
+    engine.dispose()
+    os.remove(db_path)
+    os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
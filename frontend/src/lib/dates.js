@@ -0,0 +1,6 @@
+// Local midnight as a naive ISO string (schedules are stored in wall-clock time, without an offset)
+export const startOfToday = () => {
+  const d = new Date()
+  const pad = (n) => String(n).padStart(2, '0')
+  return `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())}T00:00:00`
+}
@@ -0,0 +1,56 @@
+import { useEffect, useRef } from 'react'
+
+// Server change notifications (GET /api/events, Server-Sent Events)
+// One EventSource per tab, shared by every page that subscribes.
+// Pages reload their list when a matching event arrives instead of polling.
+const EVENT_TYPES = [
+  'approval.created', 'approval.submitted', 'approval.actioned',
+  'task.created', 'task.updated', 'schedule.created', 'notice.created', 'resync',
+]
+
+const listeners = new Set()
+let source = null
+let connectedBefore = false
+
+const dispatch = (type, data) => listeners.forEach((fn) => fn(type, data))
+
+function connect() {
+  const token = localStorage.getItem('baikal_token')
+  if (source || !token) return
+  source = new EventSource(`/api/events?access_token=${encodeURIComponent(token)}`)
+  source.addEventListener('ready', () => {
+    // Events sent while reconnecting are lost: reload once after a reconnect
+    if (connectedBefore) dispatch('resync', {})
+    connectedBefore = true
+  })
+  for (const type of EVENT_TYPES) {
+    source.addEventListener(type, (e) => dispatch(type, JSON.parse(e.data)))
+  }
+  source.onerror = () => {
+    // CLOSED means the server refused the stream (e.g. expired token); EventSource won't retry
+    if (source?.readyState === EventSource.CLOSED) disconnect()
+  }
+}
+
+export function disconnect() {
+  source?.close()
+  source = null
+  connectedBefore = false
+}
+
+// Call handler(type, data) for events whose type starts with one of prefixes (and on resync)
+export function useServerEvents(prefixes, handler) {
+  const handlerRef = useRef(handler)
+  handlerRef.current = handler
+  const key = prefixes.join(',')
+
+  useEffect(() => {
+    const fn = (type, data) => {
+      if (type === 'resync' || prefixes.some((p) => type.startsWith(p))) handlerRef.current(type, data)
+    }
+    listeners.add(fn)
+    connect()
+    // The stream stays open across page changes; logout closes it
+    return () => { listeners.delete(fn) }
+  }, [key])
+}
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react'
 import api from '../lib/api'
+import { useServerEvents } from '../lib/events'
 import { FileCheck, Send, CheckCircle, XCircle, Clock, ChevronRight } from 'lucide-react'
 
 export default function ApprovalsPage() {
@@ -9,6 +10,7 @@ export default function ApprovalsPage() {
   const [loading, setLoading] = useState(true)
 
   useEffect(() => { loadApprovals() }, [])
+  useServerEvents(['approval.'], () => loadApprovals())
 
   const loadApprovals = async () => {
     try {
@@ -2,6 +2,8 @@ import { useState, useEffect } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { useAuthStore } from '../stores/store'
 import api from '../lib/api'
+import { useServerEvents } from '../lib/events'
+import { startOfToday } from '../lib/dates'
 import {
   FileCheck, ListTodo, Calendar, Megaphone, TrendingUp, Clock,
   CheckCircle2, AlertCircle, Sparkles, ArrowUpRight, ChevronRight
@@ -16,13 +18,14 @@ export default function DashboardPage() {
   const [loading, setLoading] = useState(true)
 
   useEffect(() => { loadData() }, [])
+  useServerEvents(['approval.', 'task.', 'schedule.', 'notice.'], () => loadData())
 
   const loadData = async () => {
     try {
       const [approvals, tasks, schedules, notices] = await Promise.all([
         api.get('/approvals').then(r => r.data).catch(() => []),
         api.get('/tasks').then(r => r.data).catch(() => []),
-        api.get('/schedules').then(r => r.data).catch(() => []),
+        api.get('/schedules', { params: { from: startOfToday() } }).then(r => r.data).catch(() => []),
         api.get('/notices').then(r => r.data).catch(() => []),
       ])
       setStats({ approvals, tasks, schedules, notices })
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react'
 import api from '../lib/api'
+import { useServerEvents } from '../lib/events'
 import { Megaphone, Pin, ChevronRight } from 'lucide-react'
 
 export default function NoticesPage() {
@@ -8,6 +9,7 @@ export default function NoticesPage() {
   const [loading, setLoading] = useState(true)
 
   useEffect(() => { loadNotices() }, [])
+  useServerEvents(['notice.'], () => loadNotices())
 
   const loadNotices = async () => {
     try {
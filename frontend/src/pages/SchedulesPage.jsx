@@ -1,5 +1,7 @@
 import { useState, useEffect } from 'react'
 import api from '../lib/api'
+import { useServerEvents } from '../lib/events'
+import { startOfToday } from '../lib/dates'
 import { Calendar, MapPin, Clock } from 'lucide-react'
 
 const DAY_NAMES = ['일', '월', '화', '수', '목', '금', '토']
@@ -9,10 +11,12 @@ export default function SchedulesPage() {
   const [loading, setLoading] = useState(true)
 
   useEffect(() => { loadSchedules() }, [])
+  useServerEvents(['schedule.'], () => loadSchedules())
 
   const loadSchedules = async () => {
     try {
-      const res = await api.get('/schedules')
+      // From the start of today; past schedules are not loaded
+      const res = await api.get('/schedules', { params: { from: startOfToday() } })
       setSchedules(res.data)
     } finally {
       setLoading(false)
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react'
 import api from '../lib/api'
+import { useServerEvents } from '../lib/events'
 import { ListTodo, CheckCircle2, Clock, ArrowRight, Play, Check } from 'lucide-react'
 
 const STATUS_MAP = {
@@ -27,6 +28,7 @@ export default function TasksPage() {
   const [mobileTab, setMobileTab] = useState('todo')
 
   useEffect(() => { loadTasks() }, [])
+  useServerEvents(['task.'], () => loadTasks())
 
   const loadTasks = async () => {
     try {
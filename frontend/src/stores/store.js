@@ -1,5 +1,6 @@
 import { create } from 'zustand'
 import api from '../lib/api'
+import { disconnect as closeServerEvents } from '../lib/events'
 
 export const useAuthStore = create((set, get) => ({
   user: JSON.parse(localStorage.getItem('baikal_user') || 'null'),
@@ -16,6 +17,7 @@ export const useAuthStore = create((set, get) => ({
   },
 
   logout: () => {
+    closeServerEvents()
     localStorage.removeItem('baikal_token')
     localStorage.removeItem('baikal_user')
     set({ user: null, token: null, isAuthenticated: false })